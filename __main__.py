@@ -1,9 +1,12 @@
 import pygame
 from sys import exit
 from modules.utils import FPSCounter
-from modules.resources import MAIN_SCREEN, CENTER_SCREEN, HIDDEN_SCREEN
+from modules.resources import MAIN_SCREEN, CENTER_SCREEN, BGM
+from modules.constants import DisplayConstant
 from modules.errorlog import log
-from modules.display import CenterScreenDisplay
+from modules.display import DIRTY_TRACKER, CenterScreenDisplay
+from modules.profiler import PROFILER, Phase
+from modules.allocation import ALLOCATION_TRACKER
 from modules.interface import (
     save, 
     GameInterface, 
@@ -19,6 +22,14 @@ from modules.interface import (
 def enter_event() -> pygame.event.Event:
     return pygame.event.Event(pygame.MOUSEMOTION, pos=pygame.mouse.get_pos())
 
+def wait_events() -> list[pygame.event.Event]:
+    event = pygame.event.wait(DisplayConstant.IDLE_WAIT_TIMEOUT)
+    BGM.loop()
+    CLOCK.tick()
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event, *pygame.event.get()]
+
 def quit() -> None:
     pygame.quit()
     save()
@@ -32,51 +43,84 @@ FPS_SET = OI.settings.FPS
 CLOCK = pygame.time.Clock()
 CENTER_SCREEN_DISPLAY = CenterScreenDisplay(CENTER_SCREEN)
 FPS_COUNTER = FPSCounter(100)
+DIRTY_TRACKER.track(MAIN_SCREEN)
+DIRTY_TRACKER.track(CENTER_SCREEN)
 interface = GI
 while True:
     try:
-        FPS_COUNTER.append(CLOCK.tick(FPS_SET))
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                exit()
-            interface.add_event(event)
-        for request in interface.get_request():
-            match request:
-                case (
-                    GameRequest.QUIT | OptionRequest.QUIT 
-                    | AchievementRequest.QUIT | ControlRequest.QUIT
-                ):
-                    exit()
-                case GameRequest.GOTO_OPTIONS:
-                    interface = OI
-                    interface.add_event(enter_event())
-                case GameRequest.GOTO_ACHIEVEMENT:
-                    interface = AI
-                    interface.add_event(enter_event())
-                case GameRequest.GOTO_CONTROLS:
-                    interface = CI
-                    interface.add_event(enter_event())
-                case GameRequest.RELOAD_ACHIEVEMENT_INTERFACE:
-                    AI.set_language(OI.settings.language)
-                case OptionRequest.CHANGE_LANGUAGE:
-                    GI.language = OI.settings.language
-                    AI.set_language(OI.settings.language)
-                    CI.set_language(OI.settings.language)
-                case OptionRequest.CHANGE_FPS:
-                    FPS_SET = OI.settings.FPS
-                case OptionRequest.BACK | AchievementRequest.BACK:
-                    interface = GI
-                    interface.add_event(enter_event())
-                case ControlRequest.BACK:
-                    interface = GI
-                    interface.add_event(enter_event())
-        if interface is GI:
-            GI.display(MAIN_SCREEN, CENTER_SCREEN, FPS_SET, FPS_COUNTER.read())
+        if interface.idle:
+            if not (events := wait_events()):
+                continue
         else:
-            GI.display(HIDDEN_SCREEN, HIDDEN_SCREEN, 0, 0)
-            interface.display(MAIN_SCREEN, CENTER_SCREEN)
-        CENTER_SCREEN_DISPLAY.display(MAIN_SCREEN)
-        pygame.display.update()
+            FPS_COUNTER.append(CLOCK.tick(FPS_SET))
+            if interface is GI and not ALLOCATION_TRACKER.tracing:
+                GI.game.quality.sample(CLOCK.get_rawtime(), 1000 / FPS_SET)
+            with PROFILER.measure(Phase.EVENT_PUMP):
+                events = pygame.event.get()
+        with PROFILER.measure(Phase.ADD_EVENT):
+            for event in events:
+                if event.type == pygame.QUIT:
+                    exit()
+                if event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE):
+                    DIRTY_TRACKER.invalidate()
+                interface.add_event(event)
+        with PROFILER.measure(Phase.REQUESTS):
+            for request in interface.get_request():
+                match request:
+                    case (
+                        GameRequest.QUIT | OptionRequest.QUIT 
+                        | AchievementRequest.QUIT | ControlRequest.QUIT
+                    ):
+                        exit()
+                    case GameRequest.GOTO_OPTIONS:
+                        interface = OI
+                        interface.add_event(enter_event())
+                        GI.suspend()
+                        DIRTY_TRACKER.invalidate()
+                    case GameRequest.GOTO_ACHIEVEMENT:
+                        interface = AI
+                        interface.add_event(enter_event())
+                        GI.suspend()
+                        DIRTY_TRACKER.invalidate()
+                    case GameRequest.GOTO_CONTROLS:
+                        interface = CI
+                        interface.add_event(enter_event())
+                        GI.suspend()
+                        DIRTY_TRACKER.invalidate()
+                    case GameRequest.RELOAD_ACHIEVEMENT_INTERFACE:
+                        AI.set_language(OI.settings.language)
+                    case OptionRequest.CHANGE_LANGUAGE:
+                        GI.language = OI.settings.language
+                        AI.set_language(OI.settings.language)
+                        CI.set_language(OI.settings.language)
+                        DIRTY_TRACKER.invalidate()
+                    case OptionRequest.CHANGE_FPS:
+                        FPS_SET = OI.settings.FPS
+                    case OptionRequest.BACK | AchievementRequest.BACK:
+                        interface = GI
+                        interface.add_event(enter_event())
+                        GI.resume()
+                        DIRTY_TRACKER.invalidate()
+                    case ControlRequest.BACK:
+                        interface = GI
+                        interface.add_event(enter_event())
+                        GI.resume()
+                        DIRTY_TRACKER.invalidate()
+        center_screen = CENTER_SCREEN_DISPLAY.screen(MAIN_SCREEN)
+        with PROFILER.measure(Phase.UI_DRAW):
+            if interface is GI:
+                GI.display(MAIN_SCREEN, center_screen, FPS_SET, FPS_COUNTER.read())
+            else:
+                interface.display(MAIN_SCREEN, center_screen)
+        with PROFILER.measure(Phase.CENTER_BLIT):
+            CENTER_SCREEN_DISPLAY.display(MAIN_SCREEN)
+        with PROFILER.measure(Phase.DISPLAY_UPDATE):
+            if (rects := DIRTY_TRACKER.dirty_rects(MAIN_SCREEN)) is None:
+                pygame.display.update()
+            else:
+                pygame.display.update(rects)
+        DIRTY_TRACKER.next_frame()
+        PROFILER.next_frame()
     except (KeyboardInterrupt, SystemExit):
         quit()
         raise
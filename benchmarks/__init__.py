@@ -0,0 +1,15 @@
+'''
+Benchmarks of the vector and physics hot paths, using only the standard library. They run
+without a display, since the physics does not depend on pygame.
+
+Run the suite from the repository root:
+
+    python -m benchmarks -o benchmarks/baseline.json
+
+and compare a later run with it, failing if any case is slower by more than 10%:
+
+    python -m benchmarks --baseline benchmarks/baseline.json --threshold 0.1
+
+The baselines depend on the machine, so the JSON files in this folder are ignored by git.
+'''
+from .runner import Case, BENCHMARKS, benchmark, main
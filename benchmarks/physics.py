@@ -0,0 +1,192 @@
+from __future__ import annotations
+from modules.vector import Vector
+from modules.physics import (
+    PhysicsGround, 
+    PhysicsWall, 
+    PhysicsSlab, 
+    PhysicsRocket, 
+    PhysicsBall, 
+    BallState
+)
+from modules.constants import GeneralConstant, GameConstant, InterfaceConstant
+from modules.utils import Direction
+from .runner import Run, benchmark
+from random import seed
+
+DT = InterfaceConstant.Game.DT
+RADIUS = GeneralConstant.BALL_RADIUS
+WIDTH = GeneralConstant.DEFAULT_SCREEN_SIZE[0]
+LEVEL = GameConstant.DEFAULT_LEVEL
+ROWS = 6
+
+# Ball positions relative to a left-facing rocket at the origin, one for each region of
+# PhysicsRocket.check_collision in the order the regions are checked.
+ROCKET_REGIONS = {
+    "early exclusion": (0, 200), 
+    "right side": (90, 0), 
+    "right-top": (53, 63), 
+    "middle-top": (20, 55), 
+    "left-top": (-30, 43), 
+    "left side": (-90, 0), 
+    "left slope": (-70.33, 29.64), 
+    "right slope": (71.42, 53.03), 
+    "rightmost corner": (81, 54), 
+    "topmost right corner": (62, 66), 
+    "topmost left corner": (45, 67), 
+    "middle corner": (-12, 58), 
+    "middle-left corner": (-88, 15), 
+    "inside, no region": (0, 0)
+}
+
+# Ball positions relative to a slab at the origin with the default level size.
+SLAB_CASES = {
+    "miss, vertical exclusion": (0, 100), 
+    "miss, horizontal exclusion": (200, 0), 
+    "miss, near corner": (92, 20), 
+    "hit, top": (0, 24), 
+    "hit, side": (90, 0), 
+    "hit, corner": (85, 14)
+}
+
+def _ball_state(
+        position: tuple[float, float], 
+        velocity: tuple[float, float]
+    ) -> BallState:
+    return (*position, 0, *velocity, 0, False, None, False, 0)
+
+def _slab_rows() -> list[PhysicsSlab]:
+    '''
+    The slabs of the first rows of the default level, as generated in game.
+    '''
+    length, width = LEVEL["length"], LEVEL["width"]
+    period = length + LEVEL["separation"]
+    slabs = []
+    for row in range(ROWS):
+        y = GameConstant.GROUND_Y + GameConstant.SLAB_GAP * (row + 1)
+        velocity = LEVEL["velocity"] * (1 if row % 2 else -1)
+        for column in range(WIDTH // period + 2):
+            slabs.append(PhysicsSlab((column * period - length // 2, y), (length, width), velocity))
+    return slabs
+
+class Scene:
+    '''
+    The objects around the ball in game, passed to :meth:`PhysicsBall.tick` in the same way as
+    the game does.
+    '''
+    def __init__(self, rockets: bool = False, event_balls: bool = False) -> None:
+        seed(0)
+        self.ball = PhysicsBall((WIDTH // 2, 0), RADIUS)
+        self.fixed = (
+            PhysicsGround(GameConstant.GROUND_Y), 
+            PhysicsWall(0, Direction.RIGHT), 
+            PhysicsWall(WIDTH, Direction.LEFT)
+        )
+        self.slabs = _slab_rows()
+        self.rockets = [
+            PhysicsRocket((WIDTH * 0.25, 230), -GameConstant.ROCKET_SPEED), 
+            PhysicsRocket((WIDTH * 0.75, 430), GameConstant.ROCKET_SPEED)
+        ] if rockets else []
+        self.event_balls = [
+            PhysicsBall((WIDTH * (i + 0.5) / GameConstant.FALLING_BALLS, 600), RADIUS)
+            for i in range(GameConstant.FALLING_BALLS)
+        ] if event_balls else []
+
+    def settle(self, ticks: int = 240) -> None:
+        '''
+        Tick the ball until it rests on the ground.
+        '''
+        for _ in range(ticks):
+            self.tick(False)
+
+    def tick(self, bounce: bool) -> bool:
+        return self.ball.tick(
+            DT, bounce, self.fixed, self.slabs, self.rockets, self.event_balls
+        )
+
+    def runner(self, state: BallState, bounce: bool) -> Run:
+        '''
+        Return the function ticking the ball once from the state.
+        '''
+        ball = self.ball
+        def run() -> None:
+            ball.restore(state)
+            self.tick(bounce)
+        run.stats = ball.stats
+        return run
+
+
+def _register_slab_case(name: str, position: tuple[float, float]) -> None:
+    @benchmark(f"PhysicsSlab.check_collision: {name}")
+    def setup() -> Run:
+        slab = PhysicsSlab((0, 0), (LEVEL["length"], LEVEL["width"]), LEVEL["velocity"])
+        ball = PhysicsBall(position, RADIUS)
+        return lambda: slab.check_collision(ball)
+
+for name, position in SLAB_CASES.items():
+    _register_slab_case(name, position)
+
+def _register_rocket_case(name: str, position: tuple[float, float]) -> None:
+    @benchmark(f"PhysicsRocket.check_collision: {name}")
+    def setup() -> Run:
+        rocket = PhysicsRocket((0, 0), -GameConstant.ROCKET_SPEED)
+        ball = PhysicsBall(position, RADIUS)
+        return lambda: rocket.check_collision(ball)
+
+for name, position in ROCKET_REGIONS.items():
+    _register_rocket_case(name, position)
+
+@benchmark("PhysicsRocket.check_collision: right side, right-facing")
+def rocket_right_facing() -> Run:
+    rocket = PhysicsRocket((0, 0), GameConstant.ROCKET_SPEED)
+    ball = PhysicsBall((-90, 0), RADIUS)
+    return lambda: rocket.check_collision(ball)
+
+@benchmark("PhysicsBall.handle_friction: rolling on ground (with restore)")
+def handle_friction() -> Run:
+    ball = PhysicsBall((0, 0), RADIUS)
+    state = _ball_state((0, 0), (120, 0))
+    obj_velocity, normal_vector = Vector.zero, Vector.unit_upward
+    def run() -> None:
+        ball.restore(state)
+        ball.handle_friction(DT, obj_velocity, normal_vector)
+    return run
+
+@benchmark("PhysicsBall.collide_with_ball: head-on (with restore)")
+def collide_with_ball() -> Run:
+    ball, other = PhysicsBall((0, 0), RADIUS), PhysicsBall((2 * RADIUS - 1, 0), RADIUS)
+    state, other_state = _ball_state((0, 0), (100, 0)), _ball_state((2 * RADIUS - 1, 0), (-100, 0))
+    normal_vector = Vector.unit_leftward
+    def run() -> None:
+        ball.restore(state)
+        other.restore(other_state)
+        ball.collide_with_ball(other, normal_vector)
+    return run
+
+@benchmark("PhysicsBall.tick: resting on ground")
+def tick_on_ground() -> Run:
+    scene = Scene()
+    scene.settle()
+    return scene.runner(scene.ball.state, False)
+
+@benchmark("PhysicsBall.tick: bouncing off ground")
+def tick_bounce() -> Run:
+    scene = Scene()
+    scene.settle()
+    return scene.runner(scene.ball.state, True)
+
+@benchmark("PhysicsBall.tick: airborne between slab rows")
+def tick_airborne() -> Run:
+    scene = Scene()
+    return scene.runner(_ball_state((WIDTH // 2, 130), (60, 200)), False)
+
+@benchmark("PhysicsBall.tick: landing on a slab")
+def tick_landing() -> Run:
+    scene = Scene()
+    slab = scene.slabs[len(scene.slabs) // ROWS // 2]
+    position = slab.position.x, slab.position.y + LEVEL["width"] // 2 + RADIUS - 1
+    return scene.runner(_ball_state(position, (0, -200)), False)
+
+@benchmark("PhysicsBall.tick: airborne with rockets and event balls")
+def tick_crowded() -> Run:
+    scene = Scene(rockets=True, event_balls=True)
+    return scene.runner(_ball_state((WIDTH // 2, 330), (60, 200)), False)
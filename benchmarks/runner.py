@@ -0,0 +1,133 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from datetime import datetime
+from json import load as jsonload, dump as jsondump
+from statistics import median
+from timeit import Timer
+from typing import Any, Callable, NamedTuple
+import platform
+
+MIN_TIME = 0.2
+REPEAT = 5
+THRESHOLD = 0.1
+
+type Run = Callable[[], object]
+type Report = dict[str, Any]
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Run]
+
+
+BENCHMARKS: list[Case] = []
+
+def benchmark(name: str) -> Callable[[Callable[[], Run]], Callable[[], Run]]:
+    '''
+    Register a benchmark case. The decorated function sets up the case and returns the function
+    to be timed, and is called again before each repeat, so the timed function may change the
+    state it is given. If the timed function has a ``stats`` attribute of a
+    :class:`PhysicsStats`, its totals of the last repeat are added to the report.
+    '''
+    def decorator(setup: Callable[[], Run]) -> Callable[[], Run]:
+        BENCHMARKS.append(Case(name, setup))
+        return setup
+    return decorator
+
+def run_case(case: Case, min_time: float, repeat: int) -> dict[str, Any]:
+    '''
+    Time a case, and return the result in unit of nanosecond per call. The number of calls in a
+    repeat is chosen so that a repeat takes at least ``min_time`` seconds.
+    '''
+    number, elapsed = Timer(case.setup()).autorange()
+    number = max(1, round(number * min_time / elapsed))
+    times = []
+    for _ in range(repeat):
+        run = case.setup()
+        times.append(Timer(run).timeit(number) / number * 1e9)
+    result = {
+        "number": number, 
+        "repeat": repeat, 
+        "best": min(times), 
+        "median": median(times)
+    }
+    if (stats := getattr(run, "stats", None)) is not None:
+        result["counters"] = stats.totals
+    return result
+
+def run_all(pattern: str | None, min_time: float, repeat: int) -> Report:
+    '''
+    Run the cases of which the names contain the pattern, and return the report.
+    '''
+    results = {}
+    for case in BENCHMARKS:
+        if pattern is not None and pattern not in case.name:
+            continue
+        results[case.name] = run_case(case, min_time, repeat)
+        print(f"{case.name:<60}{results[case.name]["best"]:>12.0f} ns", flush=True)
+    return {
+        "time": datetime.now().isoformat(timespec="seconds"), 
+        "python": platform.python_version(), 
+        "platform": platform.platform(), 
+        "benchmarks": results
+    }
+
+def compare(report: Report, baseline: Report, threshold: float) -> list[str]:
+    '''
+    Compare the best times of the report with the baseline, and return the names of the cases
+    slower than the baseline by more than the threshold ratio. The cases missing in either
+    report are skipped.
+    '''
+    regressions = []
+    for name, result in report["benchmarks"].items():
+        if (base := baseline["benchmarks"].get(name)) is None:
+            continue
+        ratio = result["best"] / base["best"]
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            mark = "REGRESSION"
+        elif ratio < 1 - threshold:
+            mark = "faster"
+        else:
+            mark = ""
+        print(f"{name:<60}{base["best"]:>12.0f} -> {result["best"]:>8.0f} ns ({ratio:.2f}x) {mark}")
+    return regressions
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m benchmarks", 
+        description="Run the benchmarks of the physics and vector hot paths."
+    )
+    parser.add_argument(
+        "-k", dest="pattern", 
+        help="only run the cases of which the names contain the pattern"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=MIN_TIME, 
+        help=f"minimum time in seconds of a repeat (default: {MIN_TIME})"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=REPEAT, 
+        help=f"number of repeats of a case (default: {REPEAT})"
+    )
+    parser.add_argument("-o", "--output", help="write the report to a JSON file")
+    parser.add_argument("--baseline", help="compare with the report in a JSON file")
+    parser.add_argument(
+        "--threshold", type=float, default=THRESHOLD, 
+        help=f"slowdown ratio counted as a regression (default: {THRESHOLD})"
+    )
+    args = parser.parse_args(argv)
+
+    from . import vector, physics # register the cases
+    report = run_all(args.pattern, args.min_time, args.repeat)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            jsondump(report, file, indent=4)
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as file:
+        baseline = jsonload(file)
+    print()
+    if regressions := compare(report, baseline, args.threshold):
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
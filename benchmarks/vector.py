@@ -0,0 +1,49 @@
+from __future__ import annotations
+from modules.vector import Vector
+from .runner import Run, benchmark
+
+_A = Vector(3.5, -12.25)
+_B = Vector(-7.75, 4.5)
+
+@benchmark("Vector: add")
+def add() -> Run:
+    a, b = _A, _B
+    return lambda: a + b
+
+@benchmark("Vector: subtract")
+def subtract() -> Run:
+    a, b = _A, _B
+    return lambda: a - b
+
+@benchmark("Vector: scale")
+def scale() -> Run:
+    a = _A
+    return lambda: a * 1.5
+
+@benchmark("Vector: dot product")
+def dot_product() -> Run:
+    a, b = _A, _B
+    return lambda: a * b
+
+@benchmark("Vector: in-place add")
+def inplace_add() -> Run:
+    a, b = Vector(_A), _B
+    def run() -> None:
+        nonlocal a
+        a += b
+    return run
+
+@benchmark("Vector: project_on")
+def project_on() -> Run:
+    a, b = _A, _B
+    return lambda: a.project_on(b)
+
+@benchmark("Vector: unit")
+def unit() -> Run:
+    a = _A
+    return lambda: a.unit
+
+@benchmark("Vector: magnitude")
+def magnitude() -> Run:
+    a = _A
+    return lambda: a.magnitude
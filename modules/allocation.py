@@ -0,0 +1,156 @@
+from __future__ import annotations
+from pygame import Surface
+from .vector import Vector
+from .constants import AllocationConstant as Constant
+from .utils import RingBuffer, Timer, Ticker
+from json import dump as jsondump
+from typing import Callable
+import gc
+import tracemalloc
+
+class AllocationTracker:
+    '''
+    The sampler of the live objects and the traced memory. While the tracker is started,
+    :mod:`tracemalloc` is tracing, and a sample is taken on :meth:`tick` every
+    ``SAMPLE_INTERVAL`` seconds. Tracing slows the game down about three times, so the tracker
+    is started on its own rather than with the debug overlay. A sample holds the traced memory,
+    the counts of the :class:`Surface` and :class:`Vector` instances, and the counts given by
+    the game.
+
+    The :class:`Surface` instances are not tracked by the garbage collector, so they are found
+    as the referents of the tracked objects, which takes a full scan of the heap. The samples
+    are therefore taken rarely.
+    '''
+    __samples: RingBuffer[dict[str, float]]
+    __ticker: Ticker
+    __clock: Timer
+    __base: tracemalloc.Snapshot | None
+
+    def __init__(self) -> None:
+        self.__samples = RingBuffer(Constant.SAMPLES)
+        self.__ticker = Ticker(Constant.SAMPLE_INTERVAL)
+        self.__clock = Timer()
+        self.__base = None
+
+    def start(self) -> None:
+        '''
+        Start tracing, and clear the samples of the last run.
+        '''
+        if self.tracing:
+            return
+        tracemalloc.start(Constant.TRACEMALLOC_FRAMES)
+        self.__samples.clear()
+        self.__base = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+        self.__ticker.skip_cooldown()
+        self.__clock.restart()
+
+    def stop(self) -> None:
+        '''
+        Stop tracing. The samples are kept until the next start.
+        '''
+        if not self.tracing:
+            return
+        tracemalloc.stop()
+        self.__ticker.stop()
+        self.__clock.stop()
+
+    def tick(self, counter: Callable[[], dict[str, int]]) -> None:
+        '''
+        Take a sample if it is time to.
+
+        Parameters
+        ----------
+        counter: Callable[[], dict[str, int]]
+            The function returning the counts of the objects in the game.
+        '''
+        if self.tracing and (not self.__samples or self.__ticker.tick()):
+            self.sample(counter())
+
+    def sample(self, counts: dict[str, int]) -> None:
+        '''
+        Take a sample with the counts of the objects in the game.
+        '''
+        surfaces: dict[int, Surface] = {}
+        vectors = 0
+        for obj in gc.get_objects():
+            if type(obj) is Vector:
+                vectors += 1
+                continue
+            for referent in gc.get_referents(obj):
+                if type(referent) is tuple and not gc.is_tracked(referent):
+                    for item in referent:
+                        if isinstance(item, Surface):
+                            surfaces[id(item)] = item
+                elif isinstance(referent, Surface):
+                    surfaces[id(referent)] = referent
+        traced, peak = tracemalloc.get_traced_memory() if self.tracing else (0, 0)
+        sample = {
+            "time": round(self.__clock.read(), 1), 
+            "traced": traced, 
+            "traced peak": peak, 
+            "surfaces": len(surfaces), 
+            "surface bytes": sum(
+                surface.get_pitch() * surface.get_height()
+                for surface in surfaces.values() if surface.get_parent() is None
+            ), 
+            "vectors": vectors
+        }
+        sample.update(counts)
+        self.__samples.append(sample)
+
+    def growth(self, key: str) -> float:
+        '''
+        Return the growth of the value since the first sample. Returns 0 if there is no sample.
+        '''
+        if not self.__samples:
+            return 0
+        return self.__samples[-1][key] - self.__samples[0][key]
+
+    def dump(self, filepath: str) -> None:
+        '''
+        Write the samples to a JSON file, with the deltas from each sample to the next, the
+        growth over all the samples, and the source lines of which the traced memory grows the
+        most since the tracker is started.
+        '''
+        samples = list(self.__samples)
+        deltas = [
+            {key: sample[key] - last[key] for key in sample}
+            for last, sample in zip(samples, samples[1:])
+        ]
+        top_growth = []
+        if self.tracing and self.__base is not None:
+            snapshot = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+            top_growth = [
+                str(statistic) 
+                for statistic in snapshot.compare_to(self.__base, "lineno")
+            ][:Constant.TOP_STATISTICS]
+        with open(filepath, "w") as file:
+            jsondump(
+                {
+                    "interval": Constant.SAMPLE_INTERVAL, 
+                    "samples": samples, 
+                    "deltas": deltas, 
+                    "growth": {key: self.growth(key) for key in samples[0]} if samples else {}, 
+                    "top growth": top_growth
+                }, 
+                file, 
+                indent=4
+            )
+
+    @property
+    def tracing(self) -> bool:
+        '''
+        (Read-only) Whether :mod:`tracemalloc` is tracing.
+        '''
+        return tracemalloc.is_tracing()
+
+    @property
+    def latest(self) -> dict[str, float] | None:
+        '''
+        (Read-only) The latest sample, or `None` if there is no sample.
+        '''
+        return self.__samples[-1] if self.__samples else None
+
+
+_TRACEMALLOC_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__), )
+ALLOCATION_TRACKER = AllocationTracker()
@@ -21,6 +21,7 @@ class PhysicsConstant:
     COLLISION_ALPHA, COLLISION_BETA = 0.6, 15
     SLIDING_GAMMA, SLIDING_DELTA = 15, 0.139
     ROLLING_GAMMA, ROLLING_DELTA = 2.5, 0.1
+    EVENT_BUFFER_SIZE = 64
 
     #-------------------------DERIVED-------------------------#
     RAD_INV = 180 / pi
@@ -51,6 +52,24 @@ class GameConstant:
     BALL_PARTICLE_RANDOM_SPEED = 10
     PARTICLE_RANDOM_ANGULAR_FREQUENCY = 1.5
     UNIT_PARTICLE_SIZE = 4
+    SNAPSHOT_TICKS = 36
+    SNAPSHOT_CAPACITY = 300
+    REVIVE_REWIND_SECONDS = 2
+    SLAB_POOL_SIZE = 256
+    SLAB_LEVEL_POOL_SIZE = 16
+    ROCKET_POOL_SIZE = 16
+    BALL_POOL_SIZE = 32
+    PARTICLE_POOL_SIZE = 2048
+    WORLD_LAYER_CHUNK = 256
+    QUALITY_SMOOTHING = 0.1
+    QUALITY_DEGRADE_RATIO = 1
+    QUALITY_RESTORE_RATIO = 0.5
+    QUALITY_DEGRADE_FRAMES = 30
+    QUALITY_RESTORE_FRAMES = 300
+    QUALITY_PARTICLE_LIMIT = 512
+    QUALITY_COARSE_PARTICLE_SIZE = 8
+    QUALITY_PARTICLE_ROTATION_RESOLUTION = 45
+    QUALITY_BALL_ROTATION_RESOLUTION = 10
 
     #-------------------------DERIVED-------------------------#
     GROUND_Y = -GeneralConstant.BALL_RADIUS
@@ -63,6 +82,16 @@ class GameConstant:
     FALLING_BALL_SEP = GeneralConstant.DEFAULT_SCREEN_SIZE[0] // (FALLING_BALLS + 1)
 
 
+class DisplayConstant:
+    BALL_ROTATION_RESOLUTION = 1
+    PARTICLE_ROTATION_RESOLUTION = 15
+    TEXT_CACHE_SIZE = 256
+    GLYPH_ATLAS_CHARACTERS = "0123456789+-.:/(), "
+    DIRTY_RECTS_LIMIT = 64
+    ALIGNMENT_CACHE_SIZE = 16
+    IDLE_WAIT_TIMEOUT = 100
+
+
 class DataConstant:
     class Achievement:
         CONTINUOUS_BOUNCE_LEVELS = 30
@@ -192,5 +221,25 @@ class SettingConstant:
     FPS_CHOICE_NUMBER = len(FPS_CHOICES)
 
 
+class ProfilerConstant:
+    HISTOGRAM_WINDOW = 1024
+    HISTOGRAM_MIN_VALUE = 0.01
+    HISTOGRAM_GROWTH = 1.1
+    HISTOGRAM_BUCKETS = 100
+    PERCENTILES = (50, 95, 99)
+
+
+class AllocationConstant:
+    SAMPLE_INTERVAL = 10
+    SAMPLES = 360
+    TRACEMALLOC_FRAMES = 1
+    TOP_STATISTICS = 10
+
+
+class TracerConstant:
+    ENVIRONMENT_VARIABLE = "BOUNCE_TRACE"
+    BUFFER_SIZE = 1_000_000
+
+
 class ErrorlogConstant:
     MAX_LOGS = 50
\ No newline at end of file
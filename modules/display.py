@@ -1,19 +1,31 @@
-from pygame import Surface, Color as pgColor
+from pygame import Surface, Rect, Color as pgColor, SRCALPHA
 from pygame.font import Font
 from pygame.transform import rotate
 from .vector import Vector, NumberType
 from .language import Language, TranslateName, Translatable
-from .resources import Color
+from .constants import DisplayConstant
+from .utils import LRUCache
 from enum import Enum, Flag, auto
 from itertools import product
 from functools import reduce
-from typing import Union, Callable, Generator, NoReturn
+from typing import Union, Callable, Generator, Hashable, Iterable, NoReturn
 
 type ColorType = Union[pgColor, int, str, tuple[int, int, int], tuple[int, int, int, int]]
+type RectType = Union[Rect, tuple[int, int, int, int]]
+type BlitItem = Union[tuple[Surface, tuple[int, int]], tuple[Surface, tuple[int, int], RectType]]
+type FillItem = tuple[ColorType, RectType | None]
 
 def _typename(arg) -> str:
     return type(arg).__name__
 
+def _command_order(command: tuple) -> tuple[int, int]:
+    return command[0], command[1]
+
+def _color_key(color: ColorType | None) -> tuple[int, ...] | None:
+    if color is None or isinstance(color, tuple):
+        return color
+    return tuple(pgColor(color))
+
 class Alignment:
     '''
     The class representing an alignment mode for a displayable object. Two modes will be 
@@ -90,6 +102,7 @@ class Alignment:
     flags: Flag
     __facing: Facing
     __offset: Vector
+    __anchors: dict[tuple[tuple[int, int], tuple[int, int]], tuple[Vector, NumberType, NumberType]]
     def __init__(
             self, screen_mode: Mode, surface_mode: Mode, *flags: Flag, **kwargs
         ) -> None:
@@ -129,6 +142,7 @@ class Alignment:
         self.__surfacemeth = Alignment.__mode(surface_mode)
         self.flags = reduce(lambda flag, newflag: flag | newflag, flags, Alignment.Flag.NONE)
         self.__offset = Vector.zero
+        self.__anchors = {}
         if Alignment.Flag.FILL in self.flags:
             match facing := kwargs.get("facing"):
                 case Alignment.Facing():
@@ -181,7 +195,52 @@ class Alignment:
         :class:`Vector`
             The display coordinate.
         '''
-        return self.__screenmeth(screen) - self.__surfacemeth(surface) + self.__offset + offset
+        return self.__anchor(screen, surface)[0] + offset
+
+    def position(
+            self, 
+            screen: Surface, 
+            surface: Surface, 
+            x: NumberType = 0, 
+            y: NumberType = 0
+        ) -> tuple[int, int]:
+        '''
+        Return the integer display coordinate on the screen of the given alignment mode, which 
+        equals ``self(screen, surface, Vector(x, y)).inttuple`` but constructs no vectors.
+
+        Parameters
+        ----------
+        screen: :class:`pygame.Surface`
+            The main screen which the surface is displayed on.
+        surface: :class:`pygame.Surface`
+            The surface object to be displayed on the screen.
+        x, y: :class:`NumberType`
+            The offset of the display relative to the reference point.
+
+        Returns
+        -------
+        `tuple[int, int]`
+            The display coordinate.
+        '''
+        _, anchor_x, anchor_y = self.__anchor(screen, surface)
+        return int(anchor_x + x), int(anchor_y + y)
+
+    def __anchor(
+            self, 
+            screen: Surface, 
+            surface: Surface
+        ) -> tuple[Vector, NumberType, NumberType]:
+        '''
+        Return the display coordinate without the offset, which is memoized per pair of the 
+        screen size and the surface size.
+        '''
+        key = (screen.get_size(), surface.get_size())
+        if (anchor := self.__anchors.get(key)) is None:
+            if len(self.__anchors) >= DisplayConstant.ALIGNMENT_CACHE_SIZE:
+                self.__anchors.clear()
+            vector = self.__screenmeth(screen) - self.__surfacemeth(surface) + self.__offset
+            anchor = self.__anchors[key] = (vector, vector.x, vector.y)
+        return anchor
     
     def repeat(
             self, 
@@ -255,6 +314,175 @@ class Alignment:
             yield display + Vector(i * surface_x, j * surface_y)
     
 
+class DirtyTracker:
+    '''
+    The class recording the rectangles drawn on the tracked screens in each frame, so that only 
+    the changed part of a screen has to be presented. A rectangle drawn in the last frame is 
+    dirty as well, since what was drawn there may be gone. An untracked screen is always 
+    entirely dirty.
+
+    Static layers, which are drawn every frame with the same content, are recorded only when 
+    they change, appear or disappear.
+    '''
+    __rects: dict[Surface, list[Rect]]
+    __last_rects: dict[Surface, list[Rect]]
+    __statics: dict[Hashable, tuple[Surface, Hashable, Rect]]
+    __last_statics: dict[Hashable, tuple[Surface, Hashable, Rect]]
+    __invalidated: set[Surface]
+
+    def __init__(self) -> None:
+        self.__rects = {}
+        self.__last_rects = {}
+        self.__statics = {}
+        self.__last_statics = {}
+        self.__invalidated = set()
+
+    def track(self, screen: Surface) -> None:
+        '''
+        Start tracking the screen. The first frame of the screen is entirely dirty.
+        '''
+        self.__rects[screen] = []
+        self.__last_rects[screen] = []
+        self.__invalidated.add(screen)
+
+    def invalidate(self) -> None:
+        '''
+        Make all the tracked screens entirely dirty in this frame.
+        '''
+        self.__invalidated.update(self.__rects)
+
+    def record(self, screen: Surface, rect: Rect) -> None:
+        '''
+        Record a rectangle drawn on the screen. Empty rectangles are ignored.
+        '''
+        if rect and (rects := self.__rects.get(screen)) is not None:
+            rects.append(rect)
+
+    def record_static(self, screen: Surface, layer: Hashable, state: Hashable, rect: Rect) -> None:
+        '''
+        Record a static layer drawn on the screen. The rectangle is dirty only if the layer is 
+        not drawn on the screen in the last frame, or its state changes.
+        '''
+        if screen not in self.__rects:
+            return
+        self.__statics[layer] = (screen, state, rect)
+        last = self.__last_statics.get(layer)
+        if last is None or last[0] is not screen or last[1] != state:
+            self.__rects[screen].append(rect)
+
+    def dirty_rects(self, screen: Surface) -> list[Rect] | None:
+        '''
+        Return the dirty rectangles of the screen in this frame. Returns ``None`` if the screen 
+        is entirely dirty.
+        '''
+        if screen not in self.__rects or screen in self.__invalidated:
+            return None
+        rects = self.__rects[screen] + self.__last_rects[screen]
+        for layer, (last_screen, _, rect) in self.__last_statics.items():
+            if last_screen is screen and self.__statics.get(layer, (None, ))[0] is not screen:
+                rects.append(rect)
+        if len(rects) > DisplayConstant.DIRTY_RECTS_LIMIT:
+            return [rects[0].unionall(rects[1:])]
+        return rects
+    
+    def next_frame(self) -> None:
+        '''
+        Start recording a new frame.
+        '''
+        self.__last_rects = self.__rects
+        self.__rects = {screen: [] for screen in self.__last_rects}
+        self.__last_statics = self.__statics
+        self.__statics = {}
+        self.__invalidated.clear()
+
+
+DIRTY_TRACKER = DirtyTracker()
+
+
+class RenderQueue:
+    '''
+    The list of draw commands on the target surfaces in a frame. The commands of a target are 
+    sorted by their layers, and those in the same layer keep the order of submission. On 
+    flushing, every run of consecutive blits on a target is drawn with one 
+    :meth:`pygame.Surface.blits` call, and the drawn rectangles are recorded to 
+    :data:`DIRTY_TRACKER`.
+    '''
+    __commands: dict[Surface, list[tuple[int, int, BlitItem | None, FillItem | None]]]
+    __sequence: int
+
+    def __init__(self) -> None:
+        self.__commands = {}
+        self.__sequence = 0
+
+    def __command(
+            self, 
+            target: Surface, 
+            layer: int, 
+            blit: BlitItem | None, 
+            fill: FillItem | None
+        ) -> None:
+        if (commands := self.__commands.get(target)) is None:
+            commands = self.__commands[target] = []
+        commands.append((layer, self.__sequence, blit, fill))
+        self.__sequence += 1
+
+    def blit(self, target: Surface, item: BlitItem, layer: int = 0) -> None:
+        '''
+        Submit a blit on the target. The item is a sequence of the arguments of 
+        :meth:`pygame.Surface.blit`, that is, the source surface, the destination and optionally 
+        the area.
+        '''
+        self.__command(target, layer, item, None)
+
+    def blits(self, target: Surface, items: Iterable[BlitItem], layer: int = 0) -> None:
+        '''
+        Submit the blits of the items on the target in order.
+        '''
+        for item in items:
+            self.__command(target, layer, item, None)
+
+    def fill(
+            self, 
+            target: Surface, 
+            color: ColorType, 
+            rect: RectType | None = None, 
+            layer: int = 0
+        ) -> None:
+        '''
+        Submit a fill of the rectangle on the target. The whole target is filled if no 
+        rectangle is given.
+        '''
+        self.__command(target, layer, None, (color, rect))
+
+    def flush(self) -> None:
+        '''
+        Draw and clear the submitted commands.
+        '''
+        for target, commands in self.__commands.items():
+            commands.sort(key=_command_order)
+            batch = []
+            for _, _, blit, fill in commands:
+                if blit is not None:
+                    batch.append(blit)
+                    continue
+                if batch:
+                    self.__draw(target, batch)
+                    batch = []
+                DIRTY_TRACKER.record(target, target.fill(*fill))
+            if batch:
+                self.__draw(target, batch)
+        self.__commands.clear()
+        self.__sequence = 0
+
+    @staticmethod
+    def __draw(target: Surface, batch: list[BlitItem]) -> None:
+        for rect in target.blits(batch):
+            DIRTY_TRACKER.record(target, rect)
+
+    def __len__(self) -> int:
+        return sum(len(commands) for commands in self.__commands.values())
+
+
 class Displayable:
     '''
     The class representing a displayable object. 
@@ -282,10 +510,25 @@ class Displayable:
             The offset of the display relative to the reference point.
         '''
         if not Alignment.Flag.FILL in self.alignment.flags:
-            screen.blit(self.surface, self.alignment(screen, self.surface, offset).inttuple)
+            DIRTY_TRACKER.record(screen, screen.blit(*self.blit_item(screen, offset)))
             return
         for display in self.alignment.repeat(screen, self.surface, offset):
             screen.blit(self.surface, display.inttuple)
+        DIRTY_TRACKER.record(screen, screen.get_rect())
+
+    def blit_item(self, screen: Surface, offset: Vector) -> BlitItem:
+        '''
+        Return the surface and the display coordinate of the object, as an item of the sequence 
+        for :meth:`pygame.Surface.blits`. The alignment must not have the flag ``FILL``.
+
+        Parameters
+        ----------
+        screen: :class:`pygame.surface`
+            The main screen which the surface is displayed on.
+        offset: :class:`Vector`
+            The offset of the display relative to the reference point.
+        '''
+        return self.surface, self.alignment.position(screen, self.surface, offset.x, offset.y)
 
     def contains(
             self, 
@@ -391,6 +634,12 @@ class DisplayableText(StaticDisplayable):
     alpha: :class:`int`
         The alpha value of the surface.
     '''
+    render_cache: LRUCache[tuple, Surface] = LRUCache(DisplayConstant.TEXT_CACHE_SIZE)
+    '''
+    The rendered surfaces shared by all texts, keyed by the font, text, color, background and 
+    alpha. The cached surfaces must not be drawn on.
+    '''
+
     def __init__(
             self, 
             offset: Vector, 
@@ -410,13 +659,23 @@ class DisplayableText(StaticDisplayable):
         super().__init__(self.surface, offset, alignment)
 
     def __update_surface(self) -> None:
-        self.surface = self.__font.render(
+        key = (
+            self.__font, 
             self.__text, 
-            False, 
-            self.__color, 
-            self.__background
-        ).convert_alpha()
-        self.surface.set_alpha(self.__alpha)
+            _color_key(self.__color), 
+            _color_key(self.__background), 
+            self.__alpha
+        )
+        if (surface := DisplayableText.render_cache.get(key)) is None:
+            surface = self.__font.render(
+                self.__text, 
+                False, 
+                self.__color, 
+                self.__background
+            ).convert_alpha()
+            surface.set_alpha(self.__alpha)
+            DisplayableText.render_cache.put(key, surface)
+        self.surface = surface
 
     @property
     def font(self) -> Font:
@@ -541,10 +800,169 @@ class DisplayableTranslatable(DisplayableText):
             return
         self.text = self.__translatable.get(language)
 
+
+class GlyphAtlas:
+    '''
+    The pre-rendered glyphs of a font in a color. The characters of numeric texts are rendered 
+    on creation, and the other characters are rendered on their first use. The advance between 
+    each pair of characters is measured from the font once, so the kerning is kept.
+    '''
+    __font: Font
+    __color: ColorType
+    __glyphs: dict[str, Surface]
+    __advances: dict[str, int]
+
+    def __init__(self, font: Font, color: ColorType) -> None:
+        self.__font = font
+        self.__color = color
+        self.__glyphs = {}
+        self.__advances = {}
+        for char in DisplayConstant.GLYPH_ATLAS_CHARACTERS:
+            self.glyph(char)
+
+    def glyph(self, char: str) -> Surface:
+        '''
+        Return the rendered glyph of the character, with a colorkey as its transparency.
+        '''
+        if (glyph := self.__glyphs.get(char)) is None:
+            glyph = self.__glyphs[char] = self.__font.render(char, False, self.__color).convert()
+        return glyph
+    
+    def advance(self, pair: str) -> int:
+        '''
+        Return the horizontal distance from the first character of the pair to the second one.
+        '''
+        if (advance := self.__advances.get(pair)) is None:
+            advance = self.__advances[pair] = \
+                self.__font.size(pair)[0] - self.__font.size(pair[1])[0]
+        return advance
+
+    @property
+    def font(self) -> Font:
+        '''
+        (Read-only) The font of the glyphs.
+        '''
+        return self.__font
+    
+    @property
+    def color(self) -> ColorType:
+        '''
+        (Read-only) The color of the glyphs.
+        '''
+        return self.__color
+
+
+class DisplayableGlyphText(StaticDisplayable):
+    '''
+    The class representing a displayable text composed from the glyphs of a :class:`GlyphAtlas`, 
+    for texts that change frequently, such as numbers. The text is composed onto a reusable 
+    canvas, and only the glyphs after the first changed character are redrawn.
+
+    Attributes
+    ----------
+    surface: :class:`pygame.Surface`
+        The displaying surface of the object.
+    offset: :class:`Vector`
+        The offset of the display relative to the reference point.
+    alignment: :class:`Alignment`
+        The alignment mode of the object.
+
+    Properties
+    ----------
+    text: :class:`str`
+        The content of the text.
+    '''
+    __atlas: GlyphAtlas
+    __text: str
+    __background: ColorType
+    __alpha: int
+    __canvas: Surface
+    __positions: list[int]
+    __rights: list[int]
+    __heights: list[int]
+
+    def __init__(
+            self, 
+            offset: Vector, 
+            alignment: Alignment, 
+            atlas: GlyphAtlas, 
+            text: str = "", 
+            background: ColorType | None = None, 
+            alpha: int = 255
+    ) -> None:
+        self.__atlas = atlas
+        self.__text = ""
+        self.__background = (0, 0, 0, 0) if background is None else background
+        self.__alpha = alpha
+        self.__canvas = Surface((1, 1), SRCALPHA)
+        self.__positions = []
+        self.__rights = []
+        self.__heights = []
+        self.surface = self.__canvas.subsurface((0, 0, 0, 0))
+        self.text = text
+        super().__init__(self.surface, offset, alignment)
+
+    def __update_surface(self, text: str) -> None:
+        old_text, atlas = self.__text, self.__atlas
+        positions, rights, heights = self.__positions, self.__rights, self.__heights
+        kept = 0
+        for old_char, char in zip(old_text, text):
+            if old_char != char:
+                break
+            kept += 1
+        clear_x = positions[kept] if kept < len(old_text) else None
+        del positions[kept:], rights[kept:], heights[kept:]
+        right, height = (rights[-1], heights[-1]) if kept else (0, 0)
+        for index in range(kept, len(text)):
+            x = positions[-1] + atlas.advance(text[index - 1:index + 1]) if index else 0
+            glyph = atlas.glyph(text[index])
+            right = max(right, x + glyph.get_width())
+            height = max(height, glyph.get_height())
+            positions.append(x)
+            rights.append(right)
+            heights.append(height)
+        if clear_x is None:
+            clear_x = positions[kept] if kept < len(text) else right
+        start = kept
+        while start > 0 and rights[start - 1] > clear_x:
+            start -= 1
+
+        canvas_width, canvas_height = self.__canvas.get_size()
+        if right > canvas_width or height > canvas_height:
+            canvas_width, canvas_height = max(right, 2 * canvas_width), max(height, canvas_height)
+            self.__canvas = Surface((canvas_width, canvas_height), SRCALPHA)
+            clear_x = start = 0
+        old_width, old_height = self.surface.get_size()
+        self.__canvas.fill(
+            self.__background, 
+            (clear_x, 0, max(right, old_width) - clear_x, max(height, old_height))
+        )
+        self.__canvas.blits(
+            [
+                (atlas.glyph(text[index]), (positions[index], 0)) 
+                for index in range(start, len(text))
+            ], 
+            False
+        )
+        self.__text = text
+        self.surface = self.__canvas.subsurface((0, 0, right, height))
+        self.surface.set_alpha(self.__alpha)
+
+    @property
+    def text(self) -> str:
+        return self.__text
+
+    @text.setter
+    def text(self, __t: str) -> None:
+        if self.__text == __t:
+            return
+        self.__update_surface(__t)
+
  
 class DisplayableBall(Displayable):
     '''
-    The class representing a displayable circular object. 
+    The class representing a displayable circular object. The rotated sprites are composed 
+    once per quantized angle, and shared between the objects with the same textures.
 
     Attributes
     ----------
@@ -553,21 +971,52 @@ class DisplayableBall(Displayable):
     alignment: :class:`Alignment`
         The alignment mode of the object.
     '''
+    __sprites: dict[tuple[Surface, Surface], list[Surface | None]] = {}
+    __steps: dict[tuple[Surface, Surface], int] = {}
+    __default_steps: int = round(360 / DisplayConstant.BALL_ROTATION_RESOLUTION)
+
     def __init__(self, frame: Surface, base_surface: Surface, alignment: Alignment) -> None:
         self.frame = frame
         self.base_surface = base_surface
-        self.surface = self.frame.copy()
         self.alignment = alignment
-        self.__blit_alignment = Alignment(Alignment.Mode.CENTERED, Alignment.Mode.CENTERED)
+        self.__key = (frame, base_surface)
+        self.surface = self.__sprite(0)
 
-    def __blit(self, angle: NumberType) -> None:
-        self.surface = self.frame.copy()
-        StaticDisplayable(
-            rotate(self.base_surface, -angle), 
-            Vector.zero, 
-            self.__blit_alignment
-        ).display(self.surface)
-        
+    @classmethod
+    def set_rotation_resolution(
+            cls, 
+            degree: NumberType, 
+            frame: Surface, 
+            base_surface: Surface
+        ) -> None:
+        '''
+        Set the angular resolution of the rotated sprites of the textures, in unit of degree. A 
+        resolution of 360 degrees disables the rotation. The objects with other textures keep 
+        their resolution.
+        '''
+        key = (frame, base_surface)
+        steps = max(1, round(360 / degree))
+        if steps != cls.__steps.get(key, cls.__default_steps):
+            cls.__steps[key] = steps
+            cls.__sprites.pop(key, None)
+
+    def __sprite(self, angle: NumberType) -> Surface:
+        steps = DisplayableBall.__steps.get(self.__key, DisplayableBall.__default_steps)
+        sprites = DisplayableBall.__sprites.get(self.__key)
+        if sprites is None:
+            sprites = DisplayableBall.__sprites[self.__key] = [None] * steps
+        index = round(angle * steps / 360) % steps
+        sprite = sprites[index]
+        if sprite is None:
+            sprite = sprites[index] = self.frame.copy()
+            rotated = rotate(self.base_surface, -index * 360 / steps)
+            frame_width, frame_height = self.frame.get_size()
+            rotated_width, rotated_height = rotated.get_size()
+            sprite.blit(
+                rotated, 
+                (frame_width // 2 - rotated_width // 2, frame_height // 2 - rotated_height // 2)
+            )
+        return sprite
 
     def display(self, screen: Surface, offset: Vector, angle: NumberType) -> None:
         '''
@@ -582,12 +1031,37 @@ class DisplayableBall(Displayable):
         angle: :class:`NumberType`
             The rotation angle of the ball, in unit of degree.
         '''
-        self.__blit(angle)
-        return super().display(screen, offset)
+        DIRTY_TRACKER.record(screen, screen.blit(*self.blit_item(screen, offset, angle)))
     
+    def blit_item(self, screen: Surface, offset: Vector, angle: NumberType) -> BlitItem:
+        '''
+        Return the rotated sprite and the display coordinate of the object, as an item of the 
+        sequence for :meth:`pygame.Surface.blits`.
+        '''
+        self.surface = self.__sprite(angle)
+        return super().blit_item(screen, offset)
+
 
 class DisplayableSlab(Displayable):
+    '''
+    The class representing a displayable slab. Slabs with the same textures and size share one 
+    source texture, which is never drawn on after built. Each slab only keeps its active range 
+    of the source texture.
+
+    Attributes
+    ----------
+    surface: :class:`pygame.Surface`
+        The shared source texture of the slab.
+    alignment: :class:`Alignment`
+        The alignment mode of the object.
+    '''
     class DisplayableSubslab(StaticDisplayable):
+        '''
+        The active range of a slab. The displayed area of the source texture is cached, and 
+        updated only when the range shrinks or reloads.
+        '''
+        area: tuple[int, int, int, int]
+
         def __init__(
             self, 
             source_surface: Surface, 
@@ -600,61 +1074,53 @@ class DisplayableSlab(Displayable):
                 Alignment(Alignment.Mode.DEFAULT, Alignment.Mode.DEFAULT)
             )
             self.source_surface = source_surface
-            self.length_range = [0, length]
             self.original_length = length
             self.width = width
+            self.set_range(0, length)
+
+        def set_range(self, left: int, right: int) -> None:
+            self.length_range = [left, right]
+            self.offset = Vector(left, 0)
+            self.area = (left, 0, right - left, self.width)
+
+        def display(self, screen: Surface, position: tuple[int, int]) -> None:
+            if self.area[2]:
+                DIRTY_TRACKER.record(screen, screen.blit(*self.blit_item(position)))
 
-        def display(self, background_surface: Surface) -> None:
-            return super().display(background_surface)
+        def blit_item(self, position: tuple[int, int]) -> BlitItem:
+            return self.source_surface, (position[0] + self.area[0], position[1]), self.area
         
         def shrink_fromleft(self, length: int) -> Surface:
-            if self.length_range[1] - self.length_range[0] <= length:
-                return_surface = self.source_surface.subsurface(
-                    (self.length_range[0], 0), 
-                    (self.length_range[1] - self.length_range[0], self.width)
-                ).copy()
-                self.length_range[0] = self.length_range[1]
-            else:
-                return_surface = self.source_surface.subsurface(
-                    (self.length_range[0], 0), 
-                    (length, self.width)
-                ).copy()
-                self.length_range[0] += length
-            self.surface = self.shrunk_surface
-            self.offset = Vector(self.length_range[0], 0)
+            left, right = self.length_range
+            length = min(length, right - left)
+            return_surface = self.source_surface.subsurface(
+                (left, 0), 
+                (length, self.width)
+            ).copy()
+            self.set_range(left + length, right)
             return return_surface
         
         def shrink_fromright(self, length: int) -> Surface:
-            if self.length_range[1] - self.length_range[0] <= length:
-                return_surface = self.source_surface.subsurface(
-                    (self.length_range[0], 0), 
-                    (self.length_range[1] - self.length_range[0], self.width)
-                ).copy()
-                self.length_range[1] = self.length_range[0]
-            else:
-                return_surface = self.source_surface.subsurface(
-                    (self.length_range[1] - length, 0), 
-                    (length, self.width)
-                ).copy()
-                self.length_range[1] -= length
-            self.surface = self.shrunk_surface
+            left, right = self.length_range
+            length = min(length, right - left)
+            return_surface = self.source_surface.subsurface(
+                (right - length, 0), 
+                (length, self.width)
+            ).copy()
+            self.set_range(left, right - length)
             return return_surface
-        
-        @property
-        def shrunk_surface(self):
-            return self.source_surface.subsurface(
-                (self.length_range[0], 0), 
-                (self.length_range[1] - self.length_range[0], self.width)
-            ).convert()
     
-    def __init__(
-        self, 
-        frame: Surface, 
-        center_texture: Surface, 
-        length: int, 
-        width: int, 
-        alignment: Alignment
-    ) -> None:
+    __textures: dict[tuple[Surface, Surface, int, int], Surface] = {}
+
+    @staticmethod
+    def __texture(frame: Surface, center_texture: Surface, length: int, width: int) -> Surface:
+        '''
+        Get the shared source texture of the given textures and size, which is built on the 
+        first request.
+        '''
+        key = (frame, center_texture, length, width)
+        if (source_surface := DisplayableSlab.__textures.get(key)) is not None:
+            return source_surface
         source_surface = Surface((length, width))
         StaticDisplayable(
             frame, 
@@ -676,14 +1142,37 @@ class DisplayableSlab(Displayable):
                 facing=Alignment.Facing.ALL
             )
         ).display(source_surface.subsurface((2, 2), (length - 4, width - 4)))
-        super().__init__(Surface((length, width)), alignment)
-        self.surface.set_colorkey(Color.Game.ROCKET_TRANSPARENT)
+        DisplayableSlab.__textures[key] = source_surface
+        return source_surface
+
+    def __init__(
+        self, 
+        frame: Surface, 
+        center_texture: Surface, 
+        length: int, 
+        width: int, 
+        alignment: Alignment
+    ) -> None:
+        self.frame = frame
+        self.center_texture = center_texture
+        source_surface = DisplayableSlab.__texture(frame, center_texture, length, width)
+        super().__init__(source_surface, alignment)
         self.subdisplay = DisplayableSlab.DisplayableSubslab(source_surface, length, width)
 
     def display(self, screen: Surface, offset: Vector) -> None:
-        self.surface.fill(Color.Game.ROCKET_TRANSPARENT)
-        self.subdisplay.display(self.surface)
-        return super().display(screen, offset)
+        self.subdisplay.display(
+            screen, 
+            self.alignment.position(screen, self.surface, offset.x, offset.y)
+        )
+
+    def blit_item(self, screen: Surface, offset: Vector) -> BlitItem:
+        '''
+        Return the source texture, the display coordinate and the active area of the slab, as 
+        an item of the sequence for :meth:`pygame.Surface.blits`.
+        '''
+        return self.subdisplay.blit_item(
+            self.alignment.position(screen, self.surface, offset.x, offset.y)
+        )
     
     def contains(self, screen: Surface, offset: Vector, input_coordinate: Vector) -> NoReturn:
         raise NotImplementedError
@@ -695,19 +1184,171 @@ class DisplayableSlab(Displayable):
         return self.subdisplay.shrink_fromright(length)
     
     def reload(self) -> None:
-        self.subdisplay.surface = self.subdisplay.source_surface
-        self.subdisplay.offset = Vector.zero
-        self.subdisplay.length_range = [0, self.subdisplay.original_length]
+        self.subdisplay.set_range(0, self.subdisplay.original_length)
+
+    def reset(self, length: int, width: int) -> None:
+        '''
+        Reinitialize the slab in place with a new size.
+        '''
+        if self.surface.get_size() == (length, width):
+            return self.reload()
+        self.surface = DisplayableSlab.__texture(self.frame, self.center_texture, length, width)
+        self.subdisplay = DisplayableSlab.DisplayableSubslab(self.surface, length, width)
+
+    def restore(self, length_range: tuple[int, int]) -> None:
+        if list(length_range) != self.subdisplay.length_range:
+            self.subdisplay.set_range(*length_range)
     
 
 class DisplayableParticle(Displayable):
+    '''
+    The class representing a displayable particle. The rotated tiles are cached per quantized 
+    angle until the tile is redrawn, and :meth:`reload` must be called after that.
+
+    Attributes
+    ----------
+    base_surface: :class:`pygame.Surface`
+        The unrotated tile of the particle.
+    alignment: :class:`Alignment`
+        The alignment mode of the object.
+    '''
+    __steps: int = round(360 / DisplayConstant.PARTICLE_ROTATION_RESOLUTION)
+    __rotations: list[Surface | None]
+
     def __init__(self, surface: Surface, alignment: Alignment) -> None:
         self.base_surface = surface
         super().__init__(self.base_surface, alignment)
+        self.reload()
+
+    @classmethod
+    def set_rotation_resolution(cls, degree: NumberType) -> None:
+        '''
+        Set the angular resolution of the rotated tiles, in unit of degree. A resolution of 
+        360 degrees disables the rotation.
+        '''
+        cls.__steps = max(1, round(360 / degree))
+
+    def reload(self) -> None:
+        '''
+        Discard the rotated tiles.
+        '''
+        self.__rotations = [None] * DisplayableParticle.__steps
+
+    def __sprite(self, angle: NumberType) -> Surface:
+        steps = DisplayableParticle.__steps
+        if len(self.__rotations) != steps:
+            self.reload()
+        index = round(angle * steps / 360) % steps
+        sprite = self.__rotations[index]
+        if sprite is None:
+            sprite = self.__rotations[index] = rotate(self.base_surface, -index * 360 / steps)
+        return sprite
+
+    def blit_item(
+            self, 
+            screen: Surface, 
+            offset: Vector, 
+            angle: NumberType
+        ) -> BlitItem:
+        '''
+        Return the surface and the display coordinate of the object, as an item of the sequence 
+        for :meth:`pygame.Surface.blits`.
+
+        Parameters
+        ----------
+        screen: :class:`pygame.surface`
+            The main screen which the surface is displayed on.
+        offset: :class:`Vector`
+            The offset of the display relative to the reference point.
+        angle: :class:`NumberType`
+            The rotation angle of the particle, in unit of degree.
+        '''
+        self.surface = self.__sprite(angle)
+        return super().blit_item(screen, offset)
 
     def display(self, screen: Surface, offset: Vector, angle: NumberType) -> None:
-        self.surface = rotate(self.base_surface, -angle)
-        return super().display(screen, offset)
+        DIRTY_TRACKER.record(screen, screen.blit(*self.blit_item(screen, offset, angle)))
+
+
+class CachedLayer:
+    '''
+    A static layer composed onto its own surface once, and blitted in one call. The layer is 
+    rebuilt only when the size of the screen or the key, such as the language, changes.
+
+    Attributes
+    ----------
+    surface: Union[:class:`pygame.Surface`, ``None``]
+        The composed surface of the layer. ``None`` if the layer is not built yet.
+    '''
+    __compose: Callable[[Surface], None]
+    __area: tuple[int, int, int, int] | None
+    __colorkey: ColorType | None
+    __size: tuple[int, int] | None
+    __key: Hashable
+
+    def __init__(
+            self, 
+            compose: Callable[[Surface], None], 
+            area: tuple[int, int, int, int] | None = None, 
+            colorkey: ColorType | None = None
+    ) -> None:
+        '''
+        Parameters
+        ----------
+        compose: Callable[[:class:`pygame.Surface`], ``None``]
+            The function drawing the layer onto a surface of the size of the screen.
+        area: Optional[tuple[:class:`int`, :class:`int`, :class:`int`, :class:`int`]]
+            The rectangle of the screen covered by the layer. Only this part of the composed 
+            surface is kept. The whole screen is covered if not given.
+        colorkey: Optional[:class:`ColorType`]
+            The transparent color of the layer. The surface is filled with it before composing, 
+            so that the undrawn part of the layer shows the screen below. The layer is opaque 
+            if not given.
+        '''
+        self.__compose = compose
+        self.__area = area
+        self.__colorkey = colorkey
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        '''
+        Discard the composed surface, so the layer is rebuilt on the next display.
+        '''
+        self.surface = None
+        self.__size = None
+        self.__key = None
+
+    def __rebuild(self, screen: Surface, key: Hashable) -> None:
+        self.__size = screen.get_size()
+        self.__key = key
+        surface = Surface(self.__size, 0, screen)
+        if self.__colorkey is not None:
+            surface.fill(self.__colorkey)
+        self.__compose(surface)
+        self.surface = surface if self.__area is None else surface.subsurface(self.__area).copy()
+        if self.__colorkey is not None:
+            self.surface.set_colorkey(self.__colorkey)
+
+    def display(self, screen: Surface, key: Hashable = None) -> None:
+        '''
+        Display the layer on the screen.
+
+        Parameters
+        ----------
+        screen: :class:`pygame.Surface`
+            The screen which the layer is displayed on.
+        key: :class:`Hashable`
+            The value the layer depends on besides the size of the screen. The layer is rebuilt 
+            when the key changes.
+        '''
+        if self.surface is None or self.__size != screen.get_size() or self.__key != key:
+            self.__rebuild(screen, key)
+        DIRTY_TRACKER.record_static(
+            screen, 
+            self, 
+            self.surface, 
+            screen.blit(self.surface, (0, 0) if self.__area is None else self.__area[:2])
+        )
 
 
 class CenterScreenDisplay(StaticDisplayable):
@@ -718,8 +1359,42 @@ class CenterScreenDisplay(StaticDisplayable):
             Alignment(Alignment.Mode.CENTERED, Alignment.Mode.CENTERED)
         )
 
+    def screen(self, main_screen: Surface) -> Surface:
+        '''
+        Return the surface which the center screen is drawn on in this frame. If the main screen 
+        is of the same size as the center screen, the main screen itself is returned, so that 
+        the center screen is drawn in place and never copied. Otherwise the offscreen center 
+        screen is returned.
+        '''
+        if main_screen.get_size() == self.surface.get_size():
+            return main_screen
+        return self.surface
+
     def display(self, main_screen: Surface) -> None:
-        return super().display(main_screen)
+        '''
+        Display the center screen on the main screen. Nothing is done if the center screen is 
+        drawn in place. Only the dirty part of the center screen, and the part covered by the 
+        dirty part of the main screen, is copied if both screens are tracked by 
+        :data:`DIRTY_TRACKER`.
+        '''
+        if self.screen(main_screen) is main_screen:
+            return
+        if (
+            (rects := DIRTY_TRACKER.dirty_rects(self.surface)) is None
+            or (main_rects := DIRTY_TRACKER.dirty_rects(main_screen)) is None
+        ):
+            return super().display(main_screen)
+        x, y = self.alignment.position(main_screen, self.surface, self.offset.x, self.offset.y)
+        bounds = self.surface.get_rect()
+        rects += [
+            clipped for rect in main_rects if (clipped := rect.move(-x, -y).clip(bounds))
+        ]
+        if len(rects) > DisplayConstant.DIRTY_RECTS_LIMIT:
+            rects = [rects[0].unionall(rects[1:])]
+        for rect in main_screen.blits(
+            [(self.surface, rect.move(x, y), rect) for rect in rects]
+        ):
+            DIRTY_TRACKER.record(main_screen, rect)
     
     def contains(self, screen: Surface, input_coordinate: Vector) -> NoReturn:
         raise NotImplementedError
\ No newline at end of file
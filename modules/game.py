@@ -7,22 +7,29 @@ from .physics import (
     PhysicsRocket, 
     PhysicsBall, 
     PhysicsParticle, 
-    PhysicsObject
+    PhysicsObject, 
+    SlabState, 
+    BallState
 )
 from .vector import _isNumber, NumberType, VectorType, Vector
 from .display import (
+    DIRTY_TRACKER, 
     Alignment, 
     Displayable, 
     DisplayableBall, 
     DisplayableSlab, 
-    DisplayableParticle
+    DisplayableParticle, 
+    RenderQueue, 
+    BlitItem
 )
 from .data import Achievement, Datas
 from .errorlog import log
-from .constants import GeneralConstant, GameConstant as Constant, DataConstant
-from .resources import Texture, Color
-from .utils import Direction, LinkedList, Timer, Ticker, Chance, LinearRange
+from .constants import GeneralConstant, GameConstant as Constant, DataConstant, DisplayConstant
+from .resources import Texture, Color, Font
+from .tracer import TRACER
+from .utils import Direction, DenseArray, Handle, RingBuffer, Timer, Ticker, Chance, LinearRange
 from abc import ABC, abstractmethod
+from enum import IntEnum, auto
 from collections import deque
 from itertools import product
 from random import uniform
@@ -36,6 +43,17 @@ def get_height(level: int) -> int:
     return level * Constant.SLAB_GAP - Constant.SLAB_GAP // 2 - GeneralConstant.BALL_RADIUS
 
 
+class RenderLayer(IntEnum):
+    '''
+    The layers of the game objects in the render queue, from the bottom to the top.
+    '''
+    SLAB = auto()
+    ROCKET = auto()
+    EVENT_BALL = auto()
+    BALL = auto()
+    PARTICLE = auto()
+
+
 class GameObject(ABC):
     entity: PhysicsObject
     displayable: Displayable
@@ -47,12 +65,119 @@ class GameObject(ABC):
     @abstractmethod
     def display(self, center_screen: Surface, position_map: Callable[[Vector], Vector]) -> None:
         pass
+
+
+class EntityGroup[T: GameObject](DenseArray[T]):
+    '''
+    A :class:`DenseArray` of game objects, which also keeps the list of their physics entities 
+    in the same order. The entity of an object must not be replaced while it is in the group.
+    '''
+    __entities: list[PhysicsObject]
+    __appended: int
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__entities = []
+        self.__appended = 0
+
+    def append(self, item: T) -> Handle:
+        self.__entities.append(item.entity)
+        self.__appended += 1
+        return super().append(item)
+    
+    def remove_at(self, index: int) -> T:
+        entities = self.__entities
+        last_entity = entities.pop()
+        if index < len(entities):
+            entities[index] = last_entity
+        return super().remove_at(index)
     
-def entity_converter(
-    object_group: LinkedList[GameObject]
-) -> Generator[PhysicsObject, None, None]:
-    for object in object_group.data_iter:
-        yield object.entity
+    def clear(self) -> None:
+        self.__entities.clear()
+        super().clear()
+
+    def submit(
+        self, 
+        queue: RenderQueue, 
+        center_screen: Surface, 
+        position_map: Callable[[Vector], Vector], 
+        layer: RenderLayer
+    ) -> None:
+        '''
+        Submit the blits of the objects on the center screen to the render queue. The objects 
+        must implement ``blit_item``.
+        '''
+        queue.blits(
+            center_screen, 
+            [obj.blit_item(center_screen, position_map) for obj in self], 
+            layer
+        )
+
+    @property
+    def entities(self) -> list[PhysicsObject]:
+        '''
+        (Read-only) The physics entities of the objects. The list is updated in place, so it 
+        should be copied if the group may change while it is iterated.
+        '''
+        return self.__entities
+
+    @property
+    def appended(self) -> int:
+        '''
+        (Read-only) The number of the objects ever appended to the group.
+        '''
+        return self.__appended
+
+
+class ObjectPool[T]:
+    '''
+    A free list of released objects. Acquiring from the pool reinitializes a released object in 
+    place by calling its ``reset`` method, which takes the same arguments as its constructor. 
+    A new object is constructed only when the pool is empty.
+    '''
+    __factory: Callable[..., T]
+    __capacity: int
+    __free: list[T]
+    __created: int
+
+    def __init__(self, factory: Callable[..., T], capacity: int) -> None:
+        '''
+        Parameters
+        ----------
+        factory: Callable[..., T]
+            The constructor of the pooled objects.
+        capacity: :class:`int`
+            The maximum number of released objects kept by the pool.
+        '''
+        self.__factory = factory
+        self.__capacity = capacity
+        self.__free = []
+        self.__created = 0
+
+    def acquire(self, *args, **kwargs) -> T:
+        if self.__free:
+            obj = self.__free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+        self.__created += 1
+        return self.__factory(*args, **kwargs)
+    
+    def release(self, obj: T) -> None:
+        '''
+        Return an object to the pool. The object must not be used anymore after released.
+        '''
+        if len(self.__free) < self.__capacity:
+            self.__free.append(obj)
+
+    @property
+    def created(self) -> int:
+        '''
+        (Read-only) The number of the objects constructed by the pool.
+        '''
+        return self.__created
+
+    def __len__(self) -> int:
+        return len(self.__free)
 
 
 class Particle(GameObject):
@@ -65,11 +190,12 @@ class Particle(GameObject):
         velocity: VectorType, 
         initial_angle: NumberType, 
         angular_frequency: NumberType, 
-        surface: Surface
+        source: Surface, 
+        area: tuple[int, int, int, int]
     ) -> None:
         self.entity = PhysicsParticle(position, velocity, initial_angle, angular_frequency)
         self.displayable = DisplayableParticle(
-            surface, 
+            self.__tile(area), 
             Alignment(
                 Alignment.Mode.CENTERED, 
                 Alignment.Mode.CENTERED, 
@@ -77,7 +203,34 @@ class Particle(GameObject):
                 offset=GeneralConstant.SCREEN_OFFSET
             )
         )
-        self.largerside = max(surface.get_size())
+        self.__draw(source, area)
+
+    def reset(
+        self, 
+        position: VectorType, 
+        velocity: VectorType, 
+        initial_angle: NumberType, 
+        angular_frequency: NumberType, 
+        source: Surface, 
+        area: tuple[int, int, int, int]
+    ) -> None:
+        self.entity.reset(position, velocity, initial_angle, angular_frequency)
+        self.__draw(source, area)
+
+    @staticmethod
+    def __tile(area: tuple[int, int, int, int]) -> Surface:
+        surface = Surface(area[2:])
+        surface.set_colorkey(Color.TRANSPARENT_COLORKEY)
+        return surface
+
+    def __draw(self, source: Surface, area: tuple[int, int, int, int]) -> None:
+        surface = self.displayable.base_surface
+        if surface.get_size() != area[2:]:
+            surface = self.displayable.base_surface = self.__tile(area)
+        self.largerside = max(area[2:])
+        surface.fill(Color.TRANSPARENT_COLORKEY)
+        surface.blit(source, (0, 0), area)
+        self.displayable.reload()
 
     def tick(self, dt: float) -> None:
         self.entity.tick(dt)
@@ -89,6 +242,17 @@ class Particle(GameObject):
             self.entity.deg_angle
         )
 
+    def blit_item(
+        self, 
+        center_screen: Surface, 
+        position_map: Callable[[Vector], Vector]
+    ) -> BlitItem:
+        return self.displayable.blit_item(
+            center_screen, 
+            position_map(self.entity.position), 
+            self.entity.deg_angle
+        )
+
     def check_removal(self, bottom_y: NumberType) -> bool:
         position = self.entity.position
         return (
@@ -98,16 +262,161 @@ class Particle(GameObject):
         )
     
 
-class ParticleGroup(LinkedList[Particle]):
+class ParticleGroup(EntityGroup[Particle]):
+    '''
+    The group of the particles.
+
+    Attributes
+    ----------
+    unit_size: :class:`int`
+        The side length of the particles which the objects are shattered into.
+    limit: Optional[:class:`int`]
+        The maximum number of the live particles. The particles spawned beyond the limit are 
+        dropped. The number is unlimited if ``None``.
+    '''
+    unit_size: int
+    limit: int | None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__pool = ObjectPool(Particle, Constant.PARTICLE_POOL_SIZE)
+        self.unit_size = Constant.UNIT_PARTICLE_SIZE
+        self.limit = None
+
+    def spawn(
+        self, 
+        position: VectorType, 
+        velocity: VectorType, 
+        initial_angle: NumberType, 
+        angular_frequency: NumberType, 
+        source: Surface, 
+        area: tuple[int, int, int, int]
+    ) -> None:
+        if self.limit is not None and len(self) >= self.limit:
+            return
+        self.append(
+            self.__pool.acquire(
+                position, velocity, initial_angle, angular_frequency, source, area
+            )
+        )
+
     def tick(self, dt: float, bottom_y: NumberType) -> None:
-        for node in self.node_iter:
-            node.data.tick(dt)
-            if node.data.check_removal(bottom_y):
-                self.pop(node)
+        index = 0
+        while index < len(self):
+            (particle := self[index]).tick(dt)
+            if particle.check_removal(bottom_y):
+                self.remove_at(index)
+                self.__pool.release(particle)
+            else:
+                index += 1
+
+    def clear(self) -> None:
+        for particle in self:
+            self.__pool.release(particle)
+        super().clear()
+
+
+class QualityTier(IntEnum):
+    '''
+    The tiers of the rendering quality, from the full quality down. Each tier keeps the 
+    degradations of the tiers above it.
+    '''
+    FULL = 0
+    PARTICLE_LIMIT = auto()
+    COARSE_PARTICLES = auto()
+    LOW_ROTATION = auto()
+    NO_ROTATION = auto()
+
+
+class QualityGovernor:
+    '''
+    The governor lowering the quality tier when the frames take longer than the budget, and 
+    raising it back when there is headroom. The frame time is smoothed exponentially, and the 
+    tier is changed by one step only after the smoothed time stays beyond the threshold for a 
+    number of frames, so that occasional slow frames are ignored.
+    '''
+    __ball_textures: tuple[tuple[Surface, Surface], ...] = (
+        (Texture.BALL_FRAME, Texture.BALL_SURFACE), 
+        (Texture.BALL_FRAME_UNBOUNCEABLE, Texture.BALL_SURFACE), 
+        (Texture.BALL_FRAME_EVENT, Texture.BALL_SURFACE_EVENT)
+    )
+    __particles: ParticleGroup
+    __tier: QualityTier
+    __frame_time: float | None
+    __slow_frames: int
+    __fast_frames: int
+
+    def __init__(self, particles: ParticleGroup) -> None:
+        self.__particles = particles
+        self.__frame_time = None
+        self.set_tier(QualityTier.FULL)
+
+    def sample(self, frame_time: float, budget: float) -> None:
+        '''
+        Record the time of a frame, and change the tier if needed.
+
+        Parameters
+        ----------
+        frame_time: :class:`float`
+            The time taken by the frame excluding the delay for the frame rate, in unit of 
+            millisecond.
+        budget: :class:`float`
+            The time of a frame at the set frame rate, in unit of millisecond.
+        '''
+        if self.__frame_time is None:
+            self.__frame_time = frame_time
+        else:
+            self.__frame_time += (frame_time - self.__frame_time) * Constant.QUALITY_SMOOTHING
+        if self.__frame_time > budget * Constant.QUALITY_DEGRADE_RATIO:
+            self.__slow_frames += 1
+            self.__fast_frames = 0
+            if (
+                self.__slow_frames >= Constant.QUALITY_DEGRADE_FRAMES 
+                and self.__tier < QualityTier.NO_ROTATION
+            ):
+                self.set_tier(QualityTier(self.__tier + 1))
+        elif self.__frame_time < budget * Constant.QUALITY_RESTORE_RATIO:
+            self.__fast_frames += 1
+            self.__slow_frames = 0
+            if (
+                self.__fast_frames >= Constant.QUALITY_RESTORE_FRAMES 
+                and self.__tier > QualityTier.FULL
+            ):
+                self.set_tier(QualityTier(self.__tier - 1))
+        else:
+            self.__slow_frames = 0
+            self.__fast_frames = 0
 
-    def display(self, center_screen: Surface, position_map: Callable[[Vector], Vector]) -> None:
-        for particle in self.data_iter:
-            particle.display(center_screen, position_map)
+    def set_tier(self, tier: QualityTier) -> None:
+        '''
+        Apply the degradations of the tier. Coarser particles apply to the new shatters only. 
+        The lower rotation resolution applies to the balls in game only.
+        '''
+        self.__tier = tier
+        self.__slow_frames = 0
+        self.__fast_frames = 0
+        self.__particles.limit = Constant.QUALITY_PARTICLE_LIMIT \
+            if tier >= QualityTier.PARTICLE_LIMIT else None
+        self.__particles.unit_size = Constant.QUALITY_COARSE_PARTICLE_SIZE \
+            if tier >= QualityTier.COARSE_PARTICLES else Constant.UNIT_PARTICLE_SIZE
+        if tier >= QualityTier.NO_ROTATION:
+            ball_resolution = particle_resolution = 360
+        elif tier >= QualityTier.LOW_ROTATION:
+            ball_resolution = Constant.QUALITY_BALL_ROTATION_RESOLUTION
+            particle_resolution = Constant.QUALITY_PARTICLE_ROTATION_RESOLUTION
+        else:
+            ball_resolution = DisplayConstant.BALL_ROTATION_RESOLUTION
+            particle_resolution = DisplayConstant.PARTICLE_ROTATION_RESOLUTION
+        for frame, base_surface in QualityGovernor.__ball_textures:
+            DisplayableBall.set_rotation_resolution(ball_resolution, frame, base_surface)
+        DisplayableParticle.set_rotation_resolution(particle_resolution)
+
+    @property
+    def tier(self) -> QualityTier:
+        '''
+        (Read-only) The current quality tier.
+        '''
+        return self.__tier
 
 
 class Ground(GameObject):
@@ -135,6 +444,98 @@ class Ground(GameObject):
         self.displayable.display(center_screen, position_map(self.entity.position))
 
 
+class WorldLayer:
+    '''
+    The static part of the world, which is the white background, the level labels and the 
+    ground, kept in a strip taller than the screen. As the camera rises, the content of the 
+    strip is scrolled down by chunks and only the exposed rows are drawn. The strip is rebuilt 
+    when the camera moves below it, such as on restarting and rewinding.
+    '''
+    __ground: Ground
+    __strip: Surface
+    __top: int | None
+    '''
+    The world height of the top row of the strip.
+    '''
+
+    def __init__(self, ground: Ground) -> None:
+        self.__ground = ground
+        self.__strip = Surface(
+            (
+                GeneralConstant.DEFAULT_SCREEN_SIZE[0], 
+                GeneralConstant.DEFAULT_SCREEN_SIZE[1] + Constant.WORLD_LAYER_CHUNK
+            )
+        )
+        self.__top = None
+
+    def __draw_level(self, level: int) -> None:
+        height = get_height(level)
+        shadow = Font.Game.LEVEL_TEXT.render(str(level), False, Color.Game.LEVEL_SHADOW)
+        text = Font.Game.LEVEL_TEXT.render(str(level), False, Color.Game.LEVEL_TEXT)
+        self.__strip.blit(shadow, (9, self.__top - height + 2 - shadow.get_height() // 2))
+        self.__strip.blit(text, (5, self.__top - height - 2 - text.get_height() // 2))
+
+    def __draw_ground(self, row_start: int, row_end: int) -> None:
+        surface = self.__ground.displayable.surface
+        width, height = surface.get_size()
+        position = self.__ground.entity.position
+        if (row := self.__top - int(position.y)) < row_start:
+            row += (row_start - row) // height * height
+        x_start = (int(position.x) - width // 2) % width - width
+        for y in range(row, row_end, height):
+            for x in range(x_start, self.__strip.get_width(), width):
+                self.__strip.blit(surface, (x, y))
+
+    def __draw(self, row_start: int, row_end: int) -> None:
+        margin = Font.Game.LEVEL_TEXT.get_height()
+        self.__strip.set_clip((0, row_start, self.__strip.get_width(), row_end - row_start))
+        self.__strip.fill(Color.WHITE)
+        for level in range(
+            max(1, get_level(self.__top - row_end - margin)), 
+            get_level(self.__top - row_start + margin) + 1
+        ):
+            self.__draw_level(level)
+        self.__draw_ground(row_start, row_end)
+        self.__strip.set_clip(None)
+
+    def __rebuild(self, top: int) -> None:
+        self.__top = top + Constant.WORLD_LAYER_CHUNK
+        self.__draw(0, self.__strip.get_height())
+
+    def display(self, center_screen: Surface, reference: NumberType) -> None:
+        '''
+        Display the window of the camera on the center screen.
+
+        Parameters
+        ----------
+        center_screen: :class:`pygame.Surface`
+            The center screen of the game.
+        reference: :class:`NumberType`
+            The reference height of the camera.
+        '''
+        top = Constant.ORIGINAL_TOP_HEIGHT + int(reference)
+        if self.__top is None or top < self.__top - Constant.WORLD_LAYER_CHUNK:
+            self.__rebuild(top)
+        elif top > self.__top:
+            shift = top + Constant.WORLD_LAYER_CHUNK - self.__top
+            if shift >= self.__strip.get_height():
+                self.__rebuild(top)
+            else:
+                self.__strip.scroll(0, shift)
+                self.__top += shift
+                self.__draw(0, shift)
+        DIRTY_TRACKER.record_static(
+            center_screen, 
+            self, 
+            (self.__top, top), 
+            center_screen.blit(
+                self.__strip, 
+                (0, 0), 
+                (0, self.__top - top, *GeneralConstant.DEFAULT_SCREEN_SIZE)
+            )
+        )
+
+
 class Slab(GameObject):
     entity: PhysicsSlab
     displayable: DisplayableSlab
@@ -160,12 +561,33 @@ class Slab(GameObject):
             )
         )
 
+    def reset(
+        self, 
+        position: VectorType, 
+        length: int, 
+        width: int, 
+        velocity_x: NumberType
+    ) -> None:
+        self.entity.reset(position, (length, width), velocity_x)
+        self.displayable.reset(length, width)
+
     def tick(self, dt: float) -> None:
         self.entity.tick(dt)
 
     def display(self, center_screen: Surface, position_map: Callable[[Vector], Vector]) -> None:
         self.displayable.display(center_screen, position_map(self.entity.position))
 
+    def blit_item(
+        self, 
+        center_screen: Surface, 
+        position_map: Callable[[Vector], Vector]
+    ) -> BlitItem:
+        return self.displayable.blit_item(center_screen, position_map(self.entity.position))
+
+    def restore(self, state: SlabState) -> None:
+        self.entity.restore(state)
+        self.displayable.restore(self.entity.active_length_range)
+
     def check_rocket_collision(
         self, 
         rocket: "Rocket", 
@@ -175,75 +597,62 @@ class Slab(GameObject):
         if length == 0:
             return
         if direction == Direction.LEFT:
-            particle_group.extend(
-                self.generate_particle(
-                    self.entity.active_length_range[0] - length, 
-                    rocket_entity.position + Vector(rocket_entity.halfsize.x, 0), 
-                    self.displayable.shrink_fromleft(length)
-                )
+            self.generate_particle(
+                self.entity.active_length_range[0] - length, 
+                rocket_entity.position + Vector(rocket_entity.halfsize.x, 0), 
+                self.displayable.shrink_fromleft(length), 
+                particle_group
             )
         elif direction == Direction.RIGHT:
             surface = self.displayable.shrink_fromright(length)
-            particle_group.extend(
-                self.generate_particle(
-                    self.entity.active_length_range[1], 
-                    rocket_entity.position - Vector(rocket_entity.halfsize.x, 0), 
-                    surface
-                )
+            self.generate_particle(
+                self.entity.active_length_range[1], 
+                rocket_entity.position - Vector(rocket_entity.halfsize.x, 0), 
+                surface, 
+                particle_group
             )
 
+    @TRACER.trace()
     def generate_particle(
             self, 
             range_left: int, 
             rocket_head: Vector, 
-            surface: Surface
-        ) -> list[Particle]:
+            surface: Surface, 
+            particle_group: ParticleGroup
+        ) -> None:
+        unit_size = particle_group.unit_size
         unit_range = (
-            (surface.get_size()[0] - 1) // Constant.UNIT_PARTICLE_SIZE + 1, 
-            (surface.get_size()[1] - 1) // Constant.UNIT_PARTICLE_SIZE + 1
-        )
-        surface_size = (
-            Constant.UNIT_PARTICLE_SIZE * unit_range[0], 
-            Constant.UNIT_PARTICLE_SIZE * unit_range[1]
+            (surface.get_size()[0] - 1) // unit_size + 1, 
+            (surface.get_size()[1] - 1) // unit_size + 1
         )
-        new_surface = Surface(surface_size)
-        new_surface.fill(Color.TRANSPARENT_COLORKEY)
-        new_surface.set_colorkey(Color.TRANSPARENT_COLORKEY)
-        new_surface.blit(surface, (0, 0))
         reference = (
             self.entity.position + Vector(-self.entity.size[0], self.entity.size[1]) / 2
             + Vector(range_left + 0.5, -0.5)
         )
-        particles = []
-        unit_offset = Vector(Constant.UNIT_PARTICLE_SIZE, Constant.UNIT_PARTICLE_SIZE) / 2
+        unit_offset = Vector(unit_size, unit_size) / 2
         for x, y in product(range(unit_range[0]), range(unit_range[1])):
-            position = reference + Vector(x, -y) * Constant.UNIT_PARTICLE_SIZE + unit_offset
-            particles.append(
-                Particle(
-                    position, 
-                    (position - rocket_head) * Constant.SLAB_PARTICLE_OFFSET_SPEED
-                    + Vector(
-                        uniform(
-                            -Constant.SLAB_PARTICLE_RANDOM_SPEED, 
-                            Constant.SLAB_PARTICLE_RANDOM_SPEED
-                        ), 
-                        uniform(
-                            -Constant.SLAB_PARTICLE_RANDOM_SPEED, 
-                            Constant.SLAB_PARTICLE_RANDOM_SPEED
-                        )
-                    ), 
-                    0, 
+            position = reference + Vector(x, -y) * unit_size + unit_offset
+            particle_group.spawn(
+                position, 
+                (position - rocket_head) * Constant.SLAB_PARTICLE_OFFSET_SPEED
+                + Vector(
                     uniform(
-                        -Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY, 
-                        Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY
+                        -Constant.SLAB_PARTICLE_RANDOM_SPEED, 
+                        Constant.SLAB_PARTICLE_RANDOM_SPEED
                     ), 
-                    new_surface.subsurface(
-                        (x * Constant.UNIT_PARTICLE_SIZE, y * Constant.UNIT_PARTICLE_SIZE), 
-                        (Constant.UNIT_PARTICLE_SIZE, Constant.UNIT_PARTICLE_SIZE)
+                    uniform(
+                        -Constant.SLAB_PARTICLE_RANDOM_SPEED, 
+                        Constant.SLAB_PARTICLE_RANDOM_SPEED
                     )
-                )
+                ), 
+                0, 
+                uniform(
+                    -Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY, 
+                    Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY
+                ), 
+                surface, 
+                (x * unit_size, y * unit_size, unit_size, unit_size)
             )
-        return particles
 
 
 class Rocket(GameObject):
@@ -277,27 +686,59 @@ class Rocket(GameObject):
         )
         self.issuper = issuper
 
+    def reset(self, position: Vector, velocity_x: NumberType, issuper: bool) -> None:
+        self.entity.reset(position, velocity_x)
+        self.displayable = (
+            Rocket.__left_displayable 
+            if self.entity.facing == Direction.LEFT
+            else Rocket.__right_displayable
+        )
+        self.issuper = issuper
+
     def tick(self, dt: float) -> None:
         self.entity.tick(dt)
     
     def display(self, center_screen: Surface, position_map: Callable[[Vector], Vector]) -> None:
         self.displayable.display(center_screen, position_map(self.entity.position))
 
+    def blit_item(
+        self, 
+        center_screen: Surface, 
+        position_map: Callable[[Vector], Vector]
+    ) -> BlitItem:
+        return self.displayable.blit_item(center_screen, position_map(self.entity.position))
+
+
+class RocketGroup(EntityGroup[Rocket]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__pool = ObjectPool(Rocket, Constant.ROCKET_POOL_SIZE)
+
+    def spawn(self, position: Vector, velocity_x: NumberType, issuper: bool) -> None:
+        self.append(self.__pool.acquire(position, velocity_x, issuper))
 
-class RocketGroup(LinkedList[Rocket]):
     def tick(self, dt: float) -> Rocket | None:
+        '''
+        Tick the rockets and release the removed ones to the pool. A removed super rocket is 
+        returned, which stays intact until the next :meth:`spawn`.
+        '''
         removed = None
-        for node in self.node_iter:
-            node.data.tick(dt)
-            if node.data.entity.remove:
-                if node.data.issuper:
-                    removed = node.data
-                self.pop(node)
+        index = 0
+        while index < len(self):
+            (rocket := self[index]).tick(dt)
+            if rocket.entity.remove:
+                if rocket.issuper:
+                    removed = rocket
+                self.remove_at(index)
+                self.__pool.release(rocket)
+            else:
+                index += 1
         return removed
-    
-    def display(self, center_screen: Surface, position_map: Callable[[Vector], Vector]) -> None:
-        for rocket in self.data_iter:
-            rocket.display(center_screen, position_map)
+
+    def clear(self) -> None:
+        for rocket in self:
+            self.__pool.release(rocket)
+        super().clear()
 
 
 class Ball(GameObject):
@@ -344,6 +785,17 @@ class Ball(GameObject):
                     offset=GeneralConstant.SCREEN_OFFSET
                 )
             )
+        self.type = type
+        self.remove = False
+
+    def reset(
+        self, 
+        position: VectorType, 
+        type: Literal["normal", "unbounceable", "event"]
+    ) -> None:
+        if type != self.type:
+            return self.__init__(position, type)
+        self.entity.reset(position)
         self.remove = False
 
     def tick(
@@ -355,7 +807,7 @@ class Ball(GameObject):
     ) -> bool:
         collided = self.entity.tick(dt, bounce, *objs)
         if self.entity.crash_on_rocket:
-            particle_group.extend(self.generate_particle())
+            self.generate_particle(particle_group)
             self.remove = True
         return collided
 
@@ -366,61 +818,69 @@ class Ball(GameObject):
             self.entity.deg_angle
         )
 
+    def blit_item(
+        self, 
+        center_screen: Surface, 
+        position_map: Callable[[Vector], Vector]
+    ) -> BlitItem:
+        return self.displayable.blit_item(
+            center_screen, 
+            position_map(self.entity.position), 
+            self.entity.deg_angle
+        )
+
     def check_removal(self, bottom_y: NumberType) -> bool:
         return self.remove or self.entity.position.y + self.entity.radius <= bottom_y
 
-    def generate_particle(self) -> list[Particle]:
-        original_surface_size = self.displayable.surface.get_size()
+    @TRACER.trace()
+    def generate_particle(self, particle_group: ParticleGroup) -> None:
+        surface = self.displayable.surface
+        original_surface_size = surface.get_size()
+        unit_size = particle_group.unit_size
         unit_range = (
-            (original_surface_size[0] - 1) // Constant.UNIT_PARTICLE_SIZE + 1, 
-            (original_surface_size[1] - 1) // Constant.UNIT_PARTICLE_SIZE + 1
-        )
-        surface_size = (
-            Constant.UNIT_PARTICLE_SIZE * unit_range[0], 
-            Constant.UNIT_PARTICLE_SIZE * unit_range[1]
+            (original_surface_size[0] - 1) // unit_size + 1, 
+            (original_surface_size[1] - 1) // unit_size + 1
         )
-        new_surface = Surface(surface_size)
-        new_surface.fill(Color.TRANSPARENT_COLORKEY)
-        new_surface.set_colorkey(Color.TRANSPARENT_COLORKEY)
-        new_surface.blit(self.displayable.surface, (0, 0))
         reference = (
             self.entity.position 
             + Vector(-original_surface_size[0], original_surface_size[1]) / 2 
             + Vector(0.5, -0.5)
         )
-        particles = []
-        unit_offset = Vector(Constant.UNIT_PARTICLE_SIZE, Constant.UNIT_PARTICLE_SIZE) / 2
+        unit_offset = Vector(unit_size, unit_size) / 2
         for x, y in product(range(unit_range[0]), range(unit_range[1])):
-            position = reference + Vector(x, -y) * Constant.UNIT_PARTICLE_SIZE + unit_offset
-            particles.append(
-                Particle(
-                    position, 
-                    (position - self.entity.position) * Constant.BALL_PARTICLE_OFFSET_SPEED
-                    + Vector(
-                        uniform(
-                            -Constant.BALL_PARTICLE_RANDOM_SPEED, 
-                            Constant.BALL_PARTICLE_RANDOM_SPEED
-                        ), 
-                        uniform(
-                            -Constant.BALL_PARTICLE_RANDOM_SPEED, 
-                            Constant.BALL_PARTICLE_RANDOM_SPEED
-                        )
-                    ), 
-                    0, 
+            position = reference + Vector(x, -y) * unit_size + unit_offset
+            particle_group.spawn(
+                position, 
+                (position - self.entity.position) * Constant.BALL_PARTICLE_OFFSET_SPEED
+                + Vector(
                     uniform(
-                        -Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY, 
-                        Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY
+                        -Constant.BALL_PARTICLE_RANDOM_SPEED, 
+                        Constant.BALL_PARTICLE_RANDOM_SPEED
                     ), 
-                    new_surface.subsurface(
-                        (x * Constant.UNIT_PARTICLE_SIZE, y * Constant.UNIT_PARTICLE_SIZE), 
-                        (Constant.UNIT_PARTICLE_SIZE, Constant.UNIT_PARTICLE_SIZE)
+                    uniform(
+                        -Constant.BALL_PARTICLE_RANDOM_SPEED, 
+                        Constant.BALL_PARTICLE_RANDOM_SPEED
                     )
-                )
+                ), 
+                0, 
+                uniform(
+                    -Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY, 
+                    Constant.PARTICLE_RANDOM_ANGULAR_FREQUENCY
+                ), 
+                surface, 
+                (x * unit_size, y * unit_size, unit_size, unit_size)
             )
-        return particles
     
 
-class BallGroup(LinkedList[Ball]):
+class BallGroup(EntityGroup[Ball]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.__pool = ObjectPool(Ball, Constant.BALL_POOL_SIZE)
+
+    def spawn(self, position: VectorType) -> Ball:
+        self.append(ball := self.__pool.acquire(position, "event"))
+        return ball
+
     def tick(
         self, 
         dt: float, 
@@ -428,14 +888,19 @@ class BallGroup(LinkedList[Ball]):
         particle_group: ParticleGroup, 
         bottom_y: NumberType
     ) -> None:
-        for node in self.node_iter:
-            node.data.tick(dt, False, *objs, particle_group=particle_group)
-            if node.data.check_removal(bottom_y):
-                self.pop(node)
+        index = 0
+        while index < len(self):
+            (ball := self[index]).tick(dt, False, *objs, particle_group=particle_group)
+            if ball.check_removal(bottom_y):
+                self.remove_at(index)
+                self.__pool.release(ball)
+            else:
+                index += 1
 
-    def display(self, center_screen: Surface, position_map: Callable[[Vector], Vector]) -> None:
-        for ball in self.data_iter:
-            ball.display(center_screen, position_map)
+    def clear(self) -> None:
+        for ball in self:
+            self.__pool.release(ball)
+        super().clear()
 
 
 class Level(NamedTuple):
@@ -524,6 +989,19 @@ class LevelGenerator:
         To be documented
         '''
         self.__current = 0
+
+    def restore(self, state: int) -> None:
+        '''
+        Restore the generator to a state read from :attr:`state`.
+        '''
+        self.__current = state
+
+    @property
+    def state(self) -> int:
+        '''
+        (Read-only) The generating progress of the generator.
+        '''
+        return self.__current
         
 
 class SlabLevel:
@@ -533,11 +1011,23 @@ class SlabLevel:
     level: int
     level_info: Level | None
     __slabs: deque[Slab]
+    __slab_pool: ObjectPool[Slab]
     __recycle: Callable[[], None]
 
-    def __init__(self, level_generator: LevelGenerator) -> None:
-        level = self.level_info = level_generator.generate()
+    def __init__(self, level_generator: LevelGenerator, slab_pool: ObjectPool[Slab]) -> None:
         self.__slabs = deque()
+        self.reset(level_generator, slab_pool)
+
+    def reset(self, level_generator: LevelGenerator, slab_pool: ObjectPool[Slab]) -> None:
+        '''
+        Reinitialize the slab level in place as the next level of the generator. The current 
+        slabs are released to the slab pool, and the new ones are acquired from it.
+        '''
+        for slab in self.__slabs:
+            self.__slab_pool.release(slab)
+        self.__slabs.clear()
+        self.__slab_pool = slab_pool
+        level = self.level_info = level_generator.generate()
         self.height = SlabLevel.GENERATE_HEIGHT
         self.level = SlabLevel.LEVEL
         SlabLevel.LEVEL += 1
@@ -554,7 +1044,7 @@ class SlabLevel:
 
         for i in range(generate_sets):
             self.__slabs.append(
-                Slab(
+                slab_pool.acquire(
                     (unit_length * i + level.length // 2, SlabLevel.GENERATE_HEIGHT), 
                     level.length, 
                     level.width, 
@@ -595,6 +1085,16 @@ class SlabLevel:
             slab.entity.tick(dt)
         self.__recycle()
 
+    def restore(self, state: tuple[tuple[Slab, SlabState], ...]) -> None:
+        self.__slabs.clear()
+        for slab, slab_state in state:
+            slab.restore(slab_state)
+            self.__slabs.append(slab)
+
+    @property
+    def state(self) -> tuple[tuple[Slab, SlabState], ...]:
+        return tuple((slab, slab.entity.state) for slab in self.__slabs)
+
     @classmethod
     def reload(cls) -> None:
         cls.GENERATE_HEIGHT = Constant.GROUND_Y + Constant.SLAB_GAP
@@ -621,6 +1121,48 @@ class BallStatus(NamedTuple):
             ground=game.ball.entity.ground, 
             bounceable=game.ball.entity.bounceable
         )
+
+
+class GameSnapshot(NamedTuple):
+    tick: int
+    time: float
+    reference: NumberType
+    max_height: NumberType
+    level: int
+    generate_height: int
+    generate_level: int
+    generator_state: int
+    slab_levels: tuple[tuple[SlabLevel, tuple[tuple[Slab, SlabState], ...]], ...]
+    rockets: tuple[tuple[NumberType, NumberType, NumberType, bool], ...]
+    event_balls: tuple[BallState, ...]
+    ball: BallState
+
+    @classmethod
+    def record(cls, game: Game, tick: int, generator_state: int) -> GameSnapshot:
+        return cls(
+            tick=tick, 
+            time=game.timer.read(), 
+            reference=game.reference, 
+            max_height=game.max_height, 
+            level=game.level, 
+            generate_height=SlabLevel.GENERATE_HEIGHT, 
+            generate_level=SlabLevel.LEVEL, 
+            generator_state=generator_state, 
+            slab_levels=tuple(
+                (slab_level, slab_level.state) for slab_level in game.slab_levels
+            ), 
+            rockets=tuple(
+                (
+                    rocket.entity.position.x, 
+                    rocket.entity.position.y, 
+                    rocket.entity.velocity.x, 
+                    rocket.issuper
+                )
+                for rocket in game.rockets
+            ), 
+            event_balls=tuple(ball.entity.state for ball in game.event_balls), 
+            ball=game.ball.entity.state
+        )
         
 
 class Game:
@@ -702,7 +1244,7 @@ class Game:
             else:
                 position = (-Constant.ROCKET_HALFSIZE[0], height)
                 velocity_x = Constant.SUPER_ROCKET_SPEED if issuper else Constant.ROCKET_SPEED
-            self.game.rockets.append(Rocket(position, velocity_x, issuper))
+            self.game.rockets.spawn(position, velocity_x, issuper)
 
         @property
         def active(self) -> bool:
@@ -742,9 +1284,7 @@ class Game:
         def generate(self) -> None:
             y = self.game.reference + Constant.ORIGINAL_TOP_HEIGHT
             for i in range(1, Constant.FALLING_BALLS + 1):
-                self.game.event_balls.append(
-                    Ball(Vector(i * Constant.FALLING_BALL_SEP, y), "event")
-                )
+                self.game.event_balls.spawn(Vector(i * Constant.FALLING_BALL_SEP, y))
 
         @property
         def active(self) -> bool:
@@ -851,16 +1391,24 @@ class Game:
     ball: Ball
     ball_unbounceable: Ball
     ground: Ground
+    world_layer: WorldLayer
     wall_left: PhysicsWall
     wall_right: PhysicsWall
     slab_levels: deque[SlabLevel]
     event_balls: BallGroup
     rockets: RocketGroup
     particles: ParticleGroup
+    quality: QualityGovernor
     new_achievements: deque[Achievement]
+    snapshots: RingBuffer[GameSnapshot]
 
     def __init__(self, level_filepath: str) -> None:
         self.__level_generator = LevelGenerator(level_filepath)
+        self.__slab_pool = ObjectPool(Slab, Constant.SLAB_POOL_SIZE)
+        self.__slab_level_pool = ObjectPool(SlabLevel, Constant.SLAB_LEVEL_POOL_SIZE)
+        self.__retired_slab_levels = deque()
+        self.__ticks = 0
+        self.snapshots = RingBuffer(Constant.SNAPSHOT_CAPACITY)
         self.timer = Timer()
         self.reference = 0
         self.level = 1
@@ -870,49 +1418,57 @@ class Game:
         self.ball_unbounceable = Ball((0, 0), "unbounceable")
         self.ball_unbounceable.entity = self.ball.entity
         self.ground = Ground()
+        self.world_layer = WorldLayer(self.ground)
+        self.render_queue = RenderQueue()
         self.wall_left = PhysicsWall(0, Direction.RIGHT)
         self.wall_right = PhysicsWall(GeneralConstant.DEFAULT_SCREEN_SIZE[0], Direction.LEFT)
         self.slab_levels = deque()
         while SlabLevel.GENERATE_HEIGHT <= Constant.UPPER_SLAB_BOUNDARY:
-            self.slab_levels.append(SlabLevel(self.__level_generator))
+            self.slab_levels.append(self.__new_slab_level())
         self.event_balls = BallGroup()
         self.rockets = RocketGroup()
         self.particles = ParticleGroup()
+        self.quality = QualityGovernor(self.particles)
         self.rocket_event = Game.RocketEvent(self)
         self.falling_ball_event = Game.FallingBallEvent(self)
         self.achievement_tracer = Game.AchievementTracer(self)
         self.new_achievements = deque()
 
+    @TRACER.trace()
     def tick(self, dt: float, bounce: bool) -> None:
+        self.__ticks += 1
         if bounce:
             self.timer.start()
         bottom_y = Constant.SCREEN_BOTTOM_Y + self.reference
-        for slab_level in self.slab_levels:
-            slab_level.tick(dt)
+        with TRACER.span("slab level tick"):
+            for slab_level in self.slab_levels:
+                slab_level.tick(dt)
         if (removed_super_rocket := self.rockets.tick(dt)) is not None:
             self.achievement_tracer.high_speed_rocket_height = \
                 removed_super_rocket.entity.position.y
         self.particles.tick(dt, bottom_y)
-        self.event_balls.tick(
-            dt, 
-            (self.ground.entity, self.wall_left, self.wall_right, self.ball.entity), 
-            tuple(self.physics_slabs), 
-            tuple(entity_converter(self.rockets)), 
-            tuple(entity_converter(self.event_balls)), 
-            particle_group=self.particles, 
-            bottom_y=bottom_y
-        )
-        for slab in self.slabs:
-            for rocket in self.rockets.data_iter:
-                slab.check_rocket_collision(rocket, self.particles)
+        with TRACER.span("event ball tick"):
+            self.event_balls.tick(
+                dt, 
+                (self.ground.entity, self.wall_left, self.wall_right, self.ball.entity), 
+                tuple(self.physics_slabs), 
+                tuple(self.rockets.entities), 
+                tuple(self.event_balls.entities), 
+                particle_group=self.particles, 
+                bottom_y=bottom_y
+            )
+        with TRACER.span("slab-rocket collision"):
+            for slab in self.slabs:
+                for rocket in self.rockets:
+                    slab.check_rocket_collision(rocket, self.particles)
         if not self.gameover:
             collided = self.ball.tick(
                 dt, 
                 bounce, 
                 (self.ground.entity, self.wall_left, self.wall_right), 
                 self.physics_slabs, 
-                entity_converter(self.rockets), 
-                entity_converter(self.event_balls), 
+                self.rockets.entities, 
+                self.event_balls.entities, 
                 particle_group=self.particles
             )
             self.achievement_tracer.record(bounce, collided)
@@ -945,45 +1501,154 @@ class Game:
                 self.slab_levels
                 and self.slab_levels[0].height <= reference + Constant.LOWER_SLAB_BOUNDARY
             ):
-                self.slab_levels.popleft()
+                self.__retired_slab_levels.append((self.__ticks, self.slab_levels.popleft()))
             while SlabLevel.GENERATE_HEIGHT <= reference + Constant.UPPER_SLAB_BOUNDARY:
-                self.slab_levels.append(SlabLevel(self.__level_generator))
+                self.slab_levels.append(self.__new_slab_level())
+        if self.__ticks % Constant.SNAPSHOT_TICKS == 0 and self.timer.running:
+            self.snapshots.append(
+                GameSnapshot.record(self, self.__ticks, self.__level_generator.state)
+            )
+        self.__release_slab_levels()
+
+    @TRACER.trace("SlabLevel generation")
+    def __new_slab_level(self) -> SlabLevel:
+        return self.__slab_level_pool.acquire(self.__level_generator, self.__slab_pool)
+
+    def __release_slab_levels(self) -> None:
+        '''
+        Release the popped slab levels which are no longer referenced by any snapshot. A level 
+        popped at some tick is referenced only by the snapshots taken before that tick.
+        '''
+        oldest_tick = self.snapshots[0].tick if self.snapshots else self.__ticks
+        while self.__retired_slab_levels and self.__retired_slab_levels[0][0] <= oldest_tick:
+            self.__slab_level_pool.release(self.__retired_slab_levels.popleft()[1])
 
     def display(self, center_screen: Surface, debugging: bool) -> None:
-        self.ground.display(center_screen, self.position_map)
-        for slab in self.slabs:
-            slab.display(center_screen, self.position_map)
-        self.rockets.display(center_screen, self.position_map)
-        self.event_balls.display(center_screen, self.position_map)
+        queue, position_map = self.render_queue, self.position_map
+        self.world_layer.display(center_screen, self.reference)
+        queue.blits(
+            center_screen, 
+            [slab.blit_item(center_screen, position_map) for slab in self.slabs], 
+            RenderLayer.SLAB
+        )
+        self.rockets.submit(queue, center_screen, position_map, RenderLayer.ROCKET)
+        self.event_balls.submit(queue, center_screen, position_map, RenderLayer.EVENT_BALL)
         if not self.gameover:
-            if debugging and not self.ball.entity.bounceable:
-                self.ball_unbounceable.display(center_screen, self.position_map)
-            else:
-                self.ball.display(center_screen, self.position_map)
-        self.particles.display(center_screen, self.position_map)
+            ball = self.ball_unbounceable \
+                if debugging and not self.ball.entity.bounceable else self.ball
+            queue.blit(
+                center_screen, 
+                ball.blit_item(center_screen, position_map), 
+                RenderLayer.BALL
+            )
+        self.particles.submit(queue, center_screen, position_map, RenderLayer.PARTICLE)
+        queue.flush()
 
     def restart(self) -> None:
         self.__level_generator.reload()
+        self.__ticks = 0
+        self.snapshots.clear()
         SlabLevel.reload()
         self.timer.stop()
         self.reference = 0
         self.max_height = 0
         self.level = 1
         self.gameover = False
-        self.ball = Ball((GeneralConstant.DEFAULT_SCREEN_SIZE[0] // 2, 0), "normal")
-        self.ball_unbounceable = Ball((0, 0), "unbounceable")
-        self.ball_unbounceable.entity = self.ball.entity
-        self.event_balls = BallGroup()
-        self.rockets = RocketGroup()
-        self.particles = ParticleGroup()
-        self.slab_levels = deque()
+        self.ball.reset((GeneralConstant.DEFAULT_SCREEN_SIZE[0] // 2, 0), "normal")
+        self.event_balls.clear()
+        self.rockets.clear()
+        self.particles.clear()
+        for slab_level in self.slab_levels:
+            self.__slab_level_pool.release(slab_level)
+        for _, slab_level in self.__retired_slab_levels:
+            self.__slab_level_pool.release(slab_level)
+        self.__retired_slab_levels.clear()
+        self.slab_levels.clear()
         while SlabLevel.GENERATE_HEIGHT <= Constant.UPPER_SLAB_BOUNDARY:
-            self.slab_levels.append(SlabLevel(self.__level_generator))
+            self.slab_levels.append(self.__new_slab_level())
         self.rocket_event.reload()
         self.falling_ball_event.reload()
         self.achievement_tracer.reload()
 
+    def restore(self, snapshot: GameSnapshot) -> None:
+        '''
+        Restore the game to a snapshot in :attr:`snapshots`. The slab levels of the snapshot 
+        are reused, so nothing is regenerated. Snapshots newer than the restored one are 
+        discarded, the particles are cleared and the achievement tracing starts over.
+
+        Parameters
+        ----------
+        snapshot: :class:`GameSnapshot`
+            The snapshot to be restored.
+        '''
+        while self.snapshots and self.snapshots[-1].tick > snapshot.tick:
+            self.snapshots.pop()
+        self.__ticks = snapshot.tick
+        self.__level_generator.restore(snapshot.generator_state)
+        SlabLevel.GENERATE_HEIGHT = snapshot.generate_height
+        SlabLevel.LEVEL = snapshot.generate_level
+        self.timer.offset(snapshot.time - self.timer.read())
+        self.timer.start()
+        self.reference = snapshot.reference
+        self.max_height = snapshot.max_height
+        self.level = snapshot.level
+        self.gameover = False
+        self.ball.remove = False
+        self.ball.entity.restore(snapshot.ball)
+
+        # Levels popped after the snapshot are either restored or unreferenced
+        restored = {slab_level for slab_level, _ in snapshot.slab_levels}
+        for slab_level in self.slab_levels:
+            if slab_level not in restored:
+                self.__slab_level_pool.release(slab_level)
+        retired_slab_levels = deque()
+        for tick, slab_level in self.__retired_slab_levels:
+            if tick <= snapshot.tick:
+                retired_slab_levels.append((tick, slab_level))
+            elif slab_level not in restored:
+                self.__slab_level_pool.release(slab_level)
+        self.__retired_slab_levels = retired_slab_levels
+        self.slab_levels.clear()
+        for slab_level, state in snapshot.slab_levels:
+            slab_level.restore(state)
+            self.slab_levels.append(slab_level)
+
+        self.rockets.clear()
+        for x, y, velocity_x, issuper in snapshot.rockets:
+            self.rockets.spawn((x, y), velocity_x, issuper)
+        self.event_balls.clear()
+        for state in snapshot.event_balls:
+            self.event_balls.spawn((state[0], state[1])).entity.restore(state)
+        self.particles.clear()
+        self.achievement_tracer.reload()
+
+    def rewind(self, seconds: float) -> bool:
+        '''
+        Rewind the game by the given time, restoring the latest snapshot taken at least 
+        `seconds` earlier, or the oldest one if the buffer does not reach back that far.
+
+        Parameters
+        ----------
+        seconds: :class:`float`
+            The time to rewind, in unit of seconds.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether a snapshot was restored. Returns ``False`` if no snapshot is available.
+        '''
+        if not self.snapshots:
+            return False
+        target_time = self.timer.read() - seconds
+        for snapshot in reversed(self.snapshots):
+            if snapshot.time <= target_time:
+                break
+        self.restore(snapshot)
+        return True
+
     def revive(self) -> None:
+        if self.rewind(Constant.REVIVE_REWIND_SECONDS):
+            return
         self.gameover = False
         self.ball.remove = False
         self.ball.entity.position.x = GeneralConstant.DEFAULT_SCREEN_SIZE[0] // 2
@@ -1000,6 +1665,26 @@ class Game:
         
     def position_map(self, position: Vector) -> Vector:
         return Vector(position.x, Constant.ORIGINAL_TOP_HEIGHT + self.reference - position.y)
+
+    def count_objects(self) -> dict[str, int]:
+        '''
+        Return the numbers of the live objects of the game, and the numbers of the objects ever 
+        created or appended, for the allocation samples.
+        '''
+        return {
+            "particles": len(self.particles), 
+            "particles appended": self.particles.appended, 
+            "slab levels": len(self.slab_levels), 
+            "retired slab levels": len(self.__retired_slab_levels), 
+            "slab levels created": self.__slab_level_pool.created, 
+            "slabs": sum(1 for _ in self.slabs), 
+            "slabs created": self.__slab_pool.created, 
+            "rockets": len(self.rockets), 
+            "rockets appended": self.rockets.appended, 
+            "event balls": len(self.event_balls), 
+            "event balls appended": self.event_balls.appended, 
+            "snapshots": len(self.snapshots)
+        }
     
     @property
     def slabs(self) -> Generator[Slab, None, None]:
@@ -3,13 +3,17 @@ import pygame
 from pygame import Surface
 from pygame.event import Event as pygameEvent
 from pygame import draw
-from .game import Game, get_level, get_height
+from .game import Game, get_level
 from .display import (
     Alignment, 
+    CachedLayer, 
+    ColorType, 
     Displayable, 
     DisplayableBall, 
+    DisplayableGlyphText, 
     DisplayableText, 
     DisplayableTranslatable, 
+    GlyphAtlas, 
     StaticDisplayable
 )
 from .language import Language, TranslateName, Translatable
@@ -18,6 +22,10 @@ from .vector import Vector, NumberType
 from .physics import _to_degree
 from .data import Achievement, HighScore, Datas
 from .setting import Setting
+from .profiler import PROFILER, Phase
+from .allocation import ALLOCATION_TRACKER
+from .tracer import TRACER
+from .errorlog import log
 from .utils import LinearRange, Timer, Ticker, Chance, time_string
 from .constants import GeneralConstant, InterfaceConstant as Constant
 from random import randint
@@ -102,11 +110,17 @@ class Interface(ABC):
             facing=Alignment.Facing.ALL
         )
     )
+    MAIN_BACKGROUND_LAYER = CachedLayer(BACKGROUND.display)
+    CENTER_BACKGROUND_LAYER = CachedLayer(BACKGROUND.display)
 
     @property
     def isGameInterface(self) -> bool:
         return isinstance(self, GameInterface)
 
+    @property
+    def idle(self) -> bool:
+        return False
+
     @abstractmethod
     def add_event(self, event: pygameEvent) -> None:
         pass
@@ -134,6 +148,9 @@ class GameInterface(Interface):
         GAME_RELOAD = auto()
         GAME_RELOADED = auto()
         GAME_DEBUG = auto()
+        GAME_DUMP_PROFILE = auto()
+        GAME_TOGGLE_ALLOCATION = auto()
+        GAME_DUMP_ALLOCATION = auto()
         GAME_HIGHSCORE_UPDATE = auto()
         SELECTION_UP = auto()
         SELECTION_DOWN = auto()
@@ -246,6 +263,39 @@ class GameInterface(Interface):
                 offset=GeneralConstant.SCREEN_OFFSET
             )
         )
+        self.scoreboard_layer = CachedLayer(
+            self.__scoreboard_chrome, 
+            (0, 0, GeneralConstant.DEFAULT_SCREEN_SIZE[0], Texture.SCOREBOARD.get_height())
+        )
+        scoreboard_alignment = Alignment(
+            Alignment.Mode.CENTERED, 
+            Alignment.Mode.LEFT, 
+            Alignment.Flag.REFERENCED, 
+            offset=GeneralConstant.SCREEN_OFFSET
+        )
+        scoreboard_atlas = GlyphAtlas(Font.Game.SCOREBOARD_VALUE, Color.Game.SCOREBOARD_VALUE)
+        self.scoreboard_record_height_display = DisplayableGlyphText(
+            Vector(6, 34), 
+            scoreboard_alignment, 
+            scoreboard_atlas
+        )
+        self.scoreboard_height_display = DisplayableGlyphText(
+            Vector(286, 34), 
+            scoreboard_alignment, 
+            scoreboard_atlas
+        )
+        self.scoreboard_level_display = DisplayableGlyphText(
+            Vector(566, 34), 
+            scoreboard_alignment, 
+            scoreboard_atlas
+        )
+        self.scoreboard_time_display = DisplayableGlyphText(
+            Vector(846, 34), 
+            scoreboard_alignment, 
+            scoreboard_atlas
+        )
+        self.debug_atlas = GlyphAtlas(Font.Game.DEBUG_TEXT, Color.Game.DEBUG_TEXT)
+        self.debug_displays: list[DisplayableGlyphText] = []
         self.start_display = DisplayableTranslatable(
             Constant.Game.START_DISPLAY_POS, 
             BASIC_ALIGNMENT, 
@@ -472,6 +522,23 @@ class GameInterface(Interface):
             self.language, 
             Color.Game.PAUSE_TEXT_PRESSED
         )
+        pause_frame_area = Texture.PAUSE_FRAME.get_rect(
+            center=(
+                GeneralConstant.DEFAULT_SCREEN_SIZE[0] // 2, 
+                GeneralConstant.DEFAULT_SCREEN_SIZE[1] // 2
+            )
+        )
+        self.pause_layer = CachedLayer(
+            self.__pause_overlay, 
+            tuple(pause_frame_area), 
+            Color.TRANSPARENT_COLORKEY
+        )
+        self.confirm_layer = CachedLayer(
+            self.__confirm_overlay, 
+            tuple(pause_frame_area), 
+            Color.TRANSPARENT_COLORKEY
+        )
+        self.overlay_boxes = {}
         self.blackscene_display = StaticDisplayable(
             Surface(GeneralConstant.DEFAULT_SCREEN_SIZE), 
             Vector.zero, 
@@ -489,10 +556,12 @@ class GameInterface(Interface):
         self.tick_timer.offset(-ticks * Constant.Game.DT)
         if self.bounce and self.game.ball.entity.bounceable:
             Sound.bounce.play()
-        self.game.tick(Constant.Game.DT, self.bounce)
-        self.bounce = False
-        for _ in range(min(100, ticks - 1)):
-            self.game.tick(Constant.Game.DT, False)
+        with PROFILER.measure(Phase.GAME_TICK):
+            self.game.tick(Constant.Game.DT, self.bounce)
+            self.bounce = False
+            for _ in range(min(100, ticks - 1)):
+                self.game.tick(Constant.Game.DT, False)
+        PROFILER.count(Phase.GAME_TICK, 1 + min(100, max(0, ticks - 1)))
         self.height = max(self.height, self.game.ball.entity.position.y)
         if not self.status & (GIS.GAMEOVER | GIS.RESTART_SCREEN) and self.game.gameover:
             self.__handle_event(GIE.GAME_GAMEOVER)
@@ -503,6 +572,7 @@ class GameInterface(Interface):
             self.__add_achievement(achievement)
             self.requests.append(GameRequest.RELOAD_ACHIEVEMENT_INTERFACE)
         self.__read_debug_msg()
+        ALLOCATION_TRACKER.tick(self.game.count_objects)
         
 
     def add_event(self, event: pygameEvent) -> None:
@@ -512,6 +582,21 @@ class GameInterface(Interface):
         while self.requests:
             yield self.requests.popleft()
 
+    @property
+    def idle(self) -> bool:
+        return bool(
+            (GIS.PAUSE | GIS.PAUSE_CONFIRM) & self.status
+            and not (GIS.DISPLAY_ACHIEVEMENT | GIS.RESTARTING) & self.status
+            and not self.debugging
+        )
+
+    def suspend(self) -> None:
+        self.tick_timer.pause()
+
+    def resume(self) -> None:
+        if not (GIS.PAUSE | GIS.PAUSE_CONFIRM) & self.status:
+            self.tick_timer.start()
+
     def __restart(self) -> None:
         self.game.restart()
         self.tick_timer.restart()
@@ -545,6 +630,21 @@ class GameInterface(Interface):
             case GIE.GAME_DEBUG:
                 if not (GIS.PAUSE | GIS.PAUSE_CONFIRM) & self.status:
                     self.debugging = not self.debugging
+            case GIE.GAME_DUMP_PROFILE:
+                try:
+                    PROFILER.dump(Path.PROFILE)
+                except BaseException as e:
+                    log(e)
+            case GIE.GAME_TOGGLE_ALLOCATION:
+                if ALLOCATION_TRACKER.tracing:
+                    ALLOCATION_TRACKER.stop()
+                else:
+                    ALLOCATION_TRACKER.start()
+            case GIE.GAME_DUMP_ALLOCATION:
+                try:
+                    ALLOCATION_TRACKER.dump(Path.ALLOCATION)
+                except BaseException as e:
+                    log(e)
             case GIE.GAME_HIGHSCORE_UPDATE:
                 Datas.highscore = HighScore(self.height)
             case GIE.GAME_GAMEOVER:
@@ -767,6 +867,12 @@ class GameInterface(Interface):
                         return GIE.GAME_SPACE
                     case pygame.K_d:
                         return GIE.GAME_DEBUG
+                    case pygame.K_p if self.debugging:
+                        return GIE.GAME_DUMP_PROFILE
+                    case pygame.K_a if self.debugging:
+                        return GIE.GAME_TOGGLE_ALLOCATION
+                    case pygame.K_m if self.debugging and ALLOCATION_TRACKER.latest is not None:
+                        return GIE.GAME_DUMP_ALLOCATION
                     case pygame.K_UP:
                         return GIE.SELECTION_UP
                     case pygame.K_DOWN:
@@ -843,15 +949,20 @@ class GameInterface(Interface):
         return GIE.EMPTY
     
     def __read_debug_msg(self) -> None:
-        self.debug_msgs.extend(
-            GI.DebugMsgTimer(
-                text, 
-                Ticker(Constant.Game.DEBUG_TEXT_LASTING_TIME, start=True)
-            ) for text in self.game.ball.entity.debug_msgs
-        )
+        stats = self.game.ball.entity.stats
+        if not self.debugging:
+            stats.clear_events()
+        else:
+            self.debug_msgs.extend(
+                GI.DebugMsgTimer(
+                    event.message, 
+                    Ticker(Constant.Game.DEBUG_TEXT_LASTING_TIME, start=True)
+                ) for event in stats.read_events()
+            )
         while self.debug_msgs and self.debug_msgs[0].ticker.tick():
             self.debug_msgs.popleft()
 
+    @TRACER.trace()
     def display(
             self, 
             main_screen: Surface, 
@@ -860,12 +971,12 @@ class GameInterface(Interface):
             real_FPS: int
         ) -> None:
         super().display(main_screen, center_screen)
-        Interface.BACKGROUND.display(main_screen)
-        center_screen.fill(Color.WHITE)
+        if main_screen is not center_screen:
+            Interface.MAIN_BACKGROUND_LAYER.display(main_screen)
         if not (GIS.PAUSE | GIS.PAUSE_CONFIRM) & self.status:
             self.__tick()
-        self.__level_display(center_screen)
-        self.game.display(center_screen, self.debugging)
+        with PROFILER.measure(Phase.WORLD_DRAW):
+            self.game.display(center_screen, self.debugging)
         if self.debugging:
             self.__debug_display(center_screen, set_FPS, real_FPS)
         if (GIS.RELOADING | GIS.LOADED | GIS.STARTING) & self.status:
@@ -923,37 +1034,7 @@ class GameInterface(Interface):
             )
         )
 
-    def __level_display(self, screen: Surface) -> None:
-        def at_level(level: int) -> None:
-            DisplayableText(
-                self.game.position_map(Vector(7, get_height(level)) + Vector(2, -2)), 
-                Alignment(
-                    Alignment.Mode.CENTERED, 
-                    Alignment.Mode.LEFT, 
-                    Alignment.Flag.REFERENCED, 
-                    offset=GeneralConstant.SCREEN_OFFSET
-                ), 
-                Font.Game.LEVEL_TEXT, 
-                str(level), 
-                Color.Game.LEVEL_SHADOW
-            ).display(screen)
-            DisplayableText(
-                self.game.position_map(Vector(7, get_height(level)) - Vector(2, -2)), 
-                Alignment(
-                    Alignment.Mode.CENTERED, 
-                    Alignment.Mode.LEFT, 
-                    Alignment.Flag.REFERENCED, 
-                    offset=GeneralConstant.SCREEN_OFFSET
-                ), 
-                Font.Game.LEVEL_TEXT, 
-                str(level), 
-                Color.Game.LEVEL_TEXT
-            ).display(screen)
-        at_level(1)
-        for slab_level in self.game.slab_levels:
-            at_level(slab_level.level)
-
-    def __scoreboard_display(self, screen: Surface) -> None:
+    def __scoreboard_chrome(self, screen: Surface) -> None:
         self.scoreboard_bg.display(screen)
         scoreboard_alignment = Alignment(
             Alignment.Mode.CENTERED, 
@@ -969,13 +1050,6 @@ class GameInterface(Interface):
             self.language, 
             Color.Game.SCOREBOARD_TITLE
         ).display(screen)
-        DisplayableText(
-            Vector(6, 34), 
-            scoreboard_alignment, 
-            Font.Game.SCOREBOARD_VALUE, 
-            f"{Datas.highscore}", 
-            Color.Game.SCOREBOARD_VALUE
-        ).display(screen)
         DisplayableTranslatable(
             Vector(286, 10), 
             scoreboard_alignment, 
@@ -984,13 +1058,6 @@ class GameInterface(Interface):
             self.language, 
             Color.Game.SCOREBOARD_TITLE
         ).display(screen)
-        DisplayableText(
-            Vector(286, 34), 
-            scoreboard_alignment, 
-            Font.Game.SCOREBOARD_VALUE, 
-            f"{int(self.height)}", 
-            Color.Game.SCOREBOARD_VALUE
-        ).display(screen)
         DisplayableTranslatable(
             Vector(566, 10), 
             scoreboard_alignment, 
@@ -999,13 +1066,6 @@ class GameInterface(Interface):
             self.language, 
             Color.Game.SCOREBOARD_TITLE
         ).display(screen)
-        DisplayableText(
-            Vector(566, 34), 
-            scoreboard_alignment, 
-            Font.Game.SCOREBOARD_VALUE, 
-            f"{get_level(self.game.ball.entity.position.y)}", 
-            Color.Game.SCOREBOARD_VALUE
-        ).display(screen)
         DisplayableTranslatable(
             Vector(846, 10), 
             scoreboard_alignment, 
@@ -1014,16 +1074,30 @@ class GameInterface(Interface):
             self.language, 
             Color.Game.SCOREBOARD_TITLE
         ).display(screen)
-        DisplayableText(
-            Vector(846, 34), 
-            scoreboard_alignment, 
-            Font.Game.SCOREBOARD_VALUE, 
-            f"{time_string(self.game.timer.read())}", 
-            Color.Game.SCOREBOARD_VALUE
-        ).display(screen)
+
+    def __scoreboard_display(self, screen: Surface) -> None:
+        self.scoreboard_layer.display(screen, self.language)
+        self.scoreboard_record_height_display.text = f"{Datas.highscore}"
+        self.scoreboard_record_height_display.display(screen)
+        self.scoreboard_height_display.text = f"{int(self.height)}"
+        self.scoreboard_height_display.display(screen)
+        self.scoreboard_level_display.text = f"{get_level(self.game.ball.entity.position.y)}"
+        self.scoreboard_level_display.display(screen)
+        self.scoreboard_time_display.text = f"{time_string(self.game.timer.read())}"
+        self.scoreboard_time_display.display(screen)
 
     def __pause_display(self, center_screen: Surface) -> None:
         self.pause_blackscene.display(center_screen)
+        self.pause_layer.display(
+            center_screen, 
+            (
+                self.language, 
+                self.status & (GIS.PRESSING_CONTINUE | GIS.PRESSING_RESTART), 
+                tuple(self.pause_arrow.offset)
+            )
+        )
+
+    def __pause_overlay(self, center_screen: Surface) -> None:
         self.pause_frame.display(center_screen)
         self.pause_title.display(center_screen, self.language)
         if GIS.PRESSING_CONTINUE in self.status:
@@ -1039,6 +1113,16 @@ class GameInterface(Interface):
 
     def __confirm_display(self, center_screen: Surface) -> None:
         self.pause_blackscene.display(center_screen)
+        self.confirm_layer.display(
+            center_screen, 
+            (
+                self.language, 
+                self.status & (GIS.PRESSING_BUTTON_NO | GIS.PRESSING_BUTTON_YES), 
+                tuple(self.pause_arrow.offset)
+            )
+        )
+
+    def __confirm_overlay(self, center_screen: Surface) -> None:
         self.pause_frame.display(center_screen)
         self.pause_title.display(center_screen, self.language)
         self.pause_confirm_text.display(center_screen, self.language)
@@ -1157,59 +1241,114 @@ class GameInterface(Interface):
             f"angle: {ball_entity.deg_angle:.1f} deg / {ball_entity.rad_angle:.2f} rad", 
             f"angular frequency: {ball_entity.angular_frequency:.2f} rad/s", 
             f"ground: {ball_entity.ground_text}", 
-            f"bounceable: {("false", "true")[ball_entity.bounceable]}"
+            f"bounceable: {("false", "true")[ball_entity.bounceable]}", 
+            f"quality tier: {self.game.quality.tier:d} ({self.game.quality.tier.name.lower()})"
         ]
+        debug_texts.append(
+            "phase time p50/p95/p99 (ms, slowed by allocation tracking):"
+            if ALLOCATION_TRACKER.tracing else "phase time p50/p95/p99 (ms):"
+        )
+        for phase in Phase:
+            text = f"  {phase.value}: " \
+                + "/".join(f"{time:.2f}" for time in PROFILER.percentiles(phase))
+            if phase is Phase.GAME_TICK:
+                text += f" ({PROFILER.last_count(phase)} ticks)"
+            debug_texts.append(text)
+        counts = ball_entity.stats.last_counts
+        debug_texts.append(
+            f"collision checks/exclusions/misses: {counts["collision_check"]}/" \
+                f"{counts["exclusion"]}/{counts["miss"]}"
+        )
+        debug_texts.append(
+            f"hits ground/wall/slab/rocket/ball: {counts["collide_ground"]}/" \
+                f"{counts["collide_wall"]}/{counts["collide_slab"]}/" \
+                f"{counts["collide_rocket"]}/{counts["collide_ball"]}"
+        )
+        debug_texts.append(
+            f"stuck removals wall/ground: {counts["wall_stuck_removal"]}/" \
+                f"{counts["ground_stuck_removal"]}, friction: {counts["friction"]}"
+        )
+        if (sample := ALLOCATION_TRACKER.latest) is not None:
+            growth = ALLOCATION_TRACKER.growth
+            debug_texts.append(
+                f"traced memory: {sample["traced"] / 2 ** 20:.1f} MB " \
+                    f"({growth("traced") / 2 ** 20:+.1f} MB in {sample["time"]:.0f} s)" \
+                    + ("" if ALLOCATION_TRACKER.tracing else " (stopped)")
+            )
+            debug_texts.append(
+                f"surfaces: {sample["surfaces"]} ({growth("surfaces"):+d}), " \
+                    f"{sample["surface bytes"] / 2 ** 20:.1f} MB " \
+                    f"({growth("surface bytes") / 2 ** 20:+.1f} MB)"
+            )
+            debug_texts.append(
+                f"vectors: {sample["vectors"]} ({growth("vectors"):+d}), " \
+                    f"particles: {sample["particles"]} ({growth("particles"):+d})"
+            )
+            debug_texts.append(
+                f"slabs/levels/rockets/event balls: {sample["slabs"]}/" \
+                    f"{sample["slab levels"]}/{sample["rockets"]}/{sample["event balls"]}"
+            )
         debug_texts.extend(debug_msg.msg for debug_msg in self.debug_msgs)
-        for i, debug_text in enumerate(debug_texts):
-            DisplayableText(
-                base_position + unit_offset * i, 
-                text_alignment, 
-                Font.Game.DEBUG_TEXT, 
-                debug_text, 
-                Color.Game.DEBUG_TEXT, 
-                Color.Game.DEBUG_BACKGROUND, 
-                Constant.Game.DEBUG_TEXT_ALPHA
-            ).display(screen)
+        for i in range(len(self.debug_displays), len(debug_texts)):
+            self.debug_displays.append(
+                DisplayableGlyphText(
+                    base_position + unit_offset * i, 
+                    text_alignment, 
+                    self.debug_atlas, 
+                    background=Color.Game.DEBUG_BACKGROUND, 
+                    alpha=Constant.Game.DEBUG_TEXT_ALPHA
+                )
+            )
+        for debug_display, debug_text in zip(self.debug_displays, debug_texts):
+            debug_display.text = debug_text
+            debug_display.display(screen)
 
     def __gameover_tick(self) -> None:
         if self.transform_timer.read() > 2:
             self.__handle_event(GIE.GAME_TO_RESTART_SCREEN)
 
+    def __overlay_box(
+            self, 
+            text: DisplayableTranslatable, 
+            color: ColorType, 
+            alpha: int | None, 
+            offset: Vector
+        ) -> StaticDisplayable:
+        if (box := self.overlay_boxes.get(key := (text, self.language, alpha))) is None:
+            text.language = self.language
+            background = Surface((Vector(text.surface.get_size()) + Vector(10, 10)).inttuple)
+            background.fill(color)
+            if alpha is not None:
+                background.set_alpha(alpha)
+            text.display(background)
+            box = self.overlay_boxes[key] = StaticDisplayable(background, offset, BASIC_ALIGNMENT)
+        return box
+
     def __new_record_display(self, center_screen: Surface) -> None:
-        self.new_record_display.language = self.language
-        background = Surface(
-            (Vector(self.new_record_display.surface.get_size()) + Vector(10, 10)).inttuple
-        )
-        background.fill(Color.Game.NEW_RECORD_BACKGROUND)
-        background.set_alpha(Constant.Game.NEW_RECORD_ALPHA)
-        self.new_record_display.display(background)
-        Displayable(background, BASIC_ALIGNMENT).display(
-            center_screen, 
+        self.__overlay_box(
+            self.new_record_display, 
+            Color.Game.NEW_RECORD_BACKGROUND, 
+            Constant.Game.NEW_RECORD_ALPHA, 
             Constant.Game.NEW_RECORD_POS
-        )
+        ).display(center_screen)
 
     def __restart_screen_display(self, center_screen: Surface) -> None:
         if int(self.transform_timer.read() / 0.5) % 2 == 0:
-            self.gameover_display.language = self.language
-            background = Surface(
-                (Vector(self.gameover_display.surface.get_size()) + Vector(10, 10)).inttuple
-            )
-            background.fill(Color.Game.RESTART_BACKGROUND)
-            background.set_alpha(Constant.Game.RESTART_ALPHA)
-            self.gameover_display.display(background)
-            Displayable(background, BASIC_ALIGNMENT).display(
-                center_screen, 
+            self.__overlay_box(
+                self.gameover_display, 
+                Color.Game.RESTART_BACKGROUND, 
+                Constant.Game.RESTART_ALPHA, 
                 Constant.Game.GAMEOVER_DISPLAY_POS
-            )
+            ).display(center_screen)
 
     def __restarting_display(self, screen: Surface) -> None:
         if not GIS.PAUSE_CONFIRM in self.status:
-            background = Surface(
-                (Vector(self.gameover_display.surface.get_size()) + Vector(10, 10)).inttuple
-            )
-            background.fill(Color.Game.RESTART_BACKGROUND)
-            self.gameover_display.display(background, self.language)
-            StaticDisplayable(background, Vector(560, 580), BASIC_ALIGNMENT).display(screen)
+            self.__overlay_box(
+                self.gameover_display, 
+                Color.Game.RESTART_BACKGROUND, 
+                None, 
+                Constant.Game.GAMEOVER_DISPLAY_POS
+            ).display(screen)
 
         self.blackscene_alpha = int(
             self.transform_timer.read() * 255 / Constant.Game.GAMEOVER_FADEOUT_SECOND
@@ -1639,11 +1778,13 @@ class OptionInterface(Interface):
             elif OIS.KEY_VOLUME_DOWN in self.status:
                 self.__handle_event(OIE.UNIT_VOLUME_DOWN)
 
+    @TRACER.trace()
     def display(self, main_screen: Surface, center_screen: Surface) -> None:
         super().display(main_screen, center_screen)
         self.__tick()
-        Interface.BACKGROUND.display(main_screen)
-        Interface.BACKGROUND.display(center_screen)
+        if main_screen is not center_screen:
+            Interface.MAIN_BACKGROUND_LAYER.display(main_screen)
+        Interface.CENTER_BACKGROUND_LAYER.display(center_screen)
         self.title_display.display(center_screen, self.settings.language)
         self.__text_display(center_screen)
         self.__bar_display(center_screen)
@@ -1674,6 +1815,10 @@ class OptionInterface(Interface):
         while self.requests:
             yield self.requests.popleft()
 
+    @property
+    def idle(self) -> bool:
+        return not OIS.KEY_VOLUME_CHANGE & self.status
+
     def __handle_event(self, event: Event) -> None:
         match event:
             case OIE.SELECTION_UP:
@@ -2427,11 +2572,13 @@ class AchievementInterface(Interface):
             elif AIS.PAGE_DOWN in self.status:
                 self.__handle_event(AIE.UNIT_PAGE_DOWN)
 
+    @TRACER.trace()
     def display(self, main_screen: Surface, center_screen: Surface) -> None:
         super().display(main_screen, center_screen)
         self.__tick()
-        Interface.BACKGROUND.display(main_screen)
-        Interface.BACKGROUND.display(center_screen)
+        if main_screen is not center_screen:
+            Interface.MAIN_BACKGROUND_LAYER.display(main_screen)
+        Interface.CENTER_BACKGROUND_LAYER.display(center_screen)
         self.title.display(center_screen)
         self.inner_screen.display(center_screen)
         if not self.hide_slider:
@@ -2449,6 +2596,10 @@ class AchievementInterface(Interface):
         while self.requests:
             yield self.requests.popleft()
 
+    @property
+    def idle(self) -> bool:
+        return not (AIS.PAGE_UP | AIS.PAGE_DOWN) & self.status
+
     @staticmethod
     def text_surface(name: str, description: str) -> Surface:
         name_render = DisplayableText(
@@ -2802,10 +2953,12 @@ class ControlInterface(Interface):
             Constant.Control.ICON_TEXT_YPOS + 2 * Constant.Control.ICON_TEXT_VERTICAL_SEP
         )
 
+    @TRACER.trace()
     def display(self, main_screen: Surface, center_screen: Surface) -> None:
         super().display(main_screen, center_screen)
-        Interface.BACKGROUND.display(main_screen)
-        Interface.BACKGROUND.display(center_screen)
+        if main_screen is not center_screen:
+            Interface.MAIN_BACKGROUND_LAYER.display(main_screen)
+        Interface.CENTER_BACKGROUND_LAYER.display(center_screen)
         self.title_display.display(center_screen)
         if CIS.PRESSING_BACK in self.status:
             self.pressed_back_button.display(center_screen)
@@ -2826,6 +2979,10 @@ class ControlInterface(Interface):
         while self.requests:
             yield self.requests.popleft()
 
+    @property
+    def idle(self) -> bool:
+        return True
+
     def __handle_event(self, event: Event) -> None:
         match event:
             case CIE.CURSOR_ON_BACK:
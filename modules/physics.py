@@ -1,13 +1,21 @@
 from __future__ import annotations
 from .vector import Vector, NumberType, LengthType, VectorType, SizeType
 from .constants import GeneralConstant, PhysicsConstant as Constant
-from .utils import Direction
+from .utils import Direction, RingBuffer
+from .tracer import TRACER
 from abc import ABC, abstractmethod
+from enum import IntEnum, auto
 from typing import Literal, Iterable, NoReturn
 from itertools import product
 from random import triangular
 from math import pi
 
+type SlabState = tuple[NumberType, int, int]
+type BallState = tuple[
+    NumberType, NumberType, NumberType, NumberType, NumberType, NumberType, 
+    bool, PhysicsObject | None, bool, LengthType
+]
+
 def _sign(number: NumberType) -> Literal[-1, 0, 1]:
     '''
     Mathematical sign function.
@@ -114,6 +122,118 @@ def _wall_reflect_velocity(distance: NumberType) -> NumberType:
     return Constant.WALL_REFLECT_VELOCITY_MULTIPLIER * (distance ** 2)
 
 
+class PhysicsEvent(IntEnum):
+    '''
+    The events counted by :class:`PhysicsStats`. The events with a message are also recorded 
+    in the order they occur.
+    '''
+    COLLISION_CHECK = 0
+    EXCLUSION = auto()
+    MISS = auto()
+    FRICTION = auto()
+    BOUNCE = auto()
+    COLLIDE_GROUND = auto()
+    COLLIDE_WALL = auto()
+    COLLIDE_SLAB = auto()
+    COLLIDE_ROCKET = auto()
+    COLLIDE_BALL = auto()
+    CRASH_ROCKET = auto()
+    WALL_STUCK_REMOVAL = auto()
+    GROUND_STUCK_REMOVAL = auto()
+
+    @property
+    def message(self) -> str | None:
+        '''
+        (Read-only) The debug message of the event, or `None` if the event is only counted.
+        '''
+        return _EVENT_MESSAGES.get(self)
+
+
+_EVENT_MESSAGES = {
+    PhysicsEvent.BOUNCE: "<bounce>", 
+    PhysicsEvent.COLLIDE_GROUND: "<collide: Ground>", 
+    PhysicsEvent.COLLIDE_WALL: "<collide: Wall>", 
+    PhysicsEvent.COLLIDE_SLAB: "<collide: Slab>", 
+    PhysicsEvent.COLLIDE_ROCKET: "<collide: Rocket>", 
+    PhysicsEvent.COLLIDE_BALL: "<collide: Ball>", 
+    PhysicsEvent.CRASH_ROCKET: "<crash: Rocket>", 
+    PhysicsEvent.WALL_STUCK_REMOVAL: "<stuck removal: Wall>", 
+    PhysicsEvent.GROUND_STUCK_REMOVAL: "<stuck removal: Ground>"
+}
+# The codes of the events counted in the hot paths, as plain integers
+_COLLISION_CHECK = PhysicsEvent.COLLISION_CHECK.value
+_EXCLUSION = PhysicsEvent.EXCLUSION.value
+_MISS = PhysicsEvent.MISS.value
+_FRICTION = PhysicsEvent.FRICTION.value
+
+
+class PhysicsStats:
+    '''
+    The counters of the physics events of a ball. :attr:`counts` holds the running counts by 
+    the event codes, and is only changed in place. The counts are copied when a tick starts, 
+    and the counts of the latest tick are only worked out when read. The events with a message 
+    are also recorded in a fixed-size ring buffer as integer codes, and the messages are only 
+    formatted when read.
+    '''
+    counts: list[int]
+    __tick_start: list[int]
+    __events: RingBuffer[int]
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(PhysicsEvent)
+        self.__tick_start = [0] * len(PhysicsEvent)
+        self.__events = RingBuffer(Constant.EVENT_BUFFER_SIZE)
+
+    def record(self, event: int) -> None:
+        '''
+        Count the event and push it into the event buffer. The events only counted are added 
+        to :attr:`counts` directly instead.
+        '''
+        self.counts[event] += 1
+        self.__events.append(event)
+
+    def next_tick(self) -> None:
+        '''
+        Start counting a new tick.
+        '''
+        self.__tick_start = self.counts.copy()
+
+    def read_events(self) -> tuple[PhysicsEvent, ...]:
+        '''
+        Read the recorded events, and clear the event buffer.
+        '''
+        events = tuple(PhysicsEvent(event) for event in self.__events)
+        self.__events.clear()
+        return events
+
+    def clear_events(self) -> None:
+        '''
+        Clear the event buffer without reading it.
+        '''
+        self.__events.clear()
+
+    def clear(self) -> None:
+        self.counts[:] = self.__tick_start = [0] * len(PhysicsEvent)
+        self.__events.clear()
+
+    @property
+    def last_counts(self) -> dict[str, int]:
+        '''
+        (Read-only) The counts of the events in the latest tick, by the event names.
+        '''
+        return {
+            event.name.lower(): self.counts[event] - self.__tick_start[event] 
+            for event in PhysicsEvent
+        }
+
+    @property
+    def totals(self) -> dict[str, int]:
+        '''
+        (Read-only) The counts of the events in all the ticks, by the event names.
+        '''
+        return {event.name.lower(): self.counts[event] for event in PhysicsEvent}
+
+
 class PhysicsObject(ABC):
     '''
     The meta class representing physical interaction of an object.
@@ -300,6 +420,12 @@ class PhysicsSlab(PhysicsObject):
         velocity_x: :class:`NumberType`
             The constant horizontal velocity of the slab.
         '''
+        self.reset(position, size, velocity_x)
+
+    def reset(self, position: VectorType, size: SizeType, velocity_x: NumberType) -> None:
+        '''
+        Reinitialize the slab in place. The parameters are the same as the constructor.
+        '''
         self.__pos = Vector(position)
         self.__v = Vector(velocity_x, 0)
         self.__size = tuple(size)
@@ -388,6 +514,19 @@ class PhysicsSlab(PhysicsObject):
     def reload(self) -> None:
         self.__active_length_range = [0, self.__size[0]]
 
+    def restore(self, state: SlabState) -> None:
+        '''
+        Restore the slab to a state read from :attr:`state`.
+
+        Parameters
+        ----------
+        state: :class:`SlabState`
+            The state to be restored.
+        '''
+        x, left, right = state
+        self.__pos.x = x
+        self.__active_length_range = [left, right]
+
     @property
     def position(self) -> Vector:
         '''
@@ -434,6 +573,14 @@ class PhysicsSlab(PhysicsObject):
         '''
         return self.__size
     
+    @property
+    def state(self) -> SlabState:
+        '''
+        (Read-only) A compact copy of the mutable state of the slab, which can be passed to 
+        :meth:`restore`.
+        '''
+        return self.__pos.x, self.__active_length_range[0], self.__active_length_range[1]
+    
     @property
     def velocity(self):
         '''
@@ -461,9 +608,15 @@ class PhysicsRocket(PhysicsObject):
         velocity_x: :class:`NumberType`
             The constant horizontal velocity of the rocket.
         '''
+        self.__halfsize = Vector(75, 50)
+        self.reset(position, velocity_x)
+
+    def reset(self, position: VectorType, velocity_x: NumberType) -> None:
+        '''
+        Reinitialize the rocket in place. The parameters are the same as the constructor.
+        '''
         self.__pos = Vector(position)
         self.__v = Vector(velocity_x, 0)
-        self.__halfsize = Vector(75, 50)
         self.__facing = Direction.LEFT if velocity_x < 0 else Direction.RIGHT
 
     def tick(self, dt: float) -> None:
@@ -635,7 +788,8 @@ class PhysicsBall(PhysicsObject):
     __collided: bool
     __collision_exceptions: list[PhysicsObject]
     __crash_on_rocket: bool
-    __debug_msgs: list[str]
+    __stats: PhysicsStats
+    __counts: list[int]
 
     def __init__(self, position: VectorType, radius: LengthType) -> None:
         '''
@@ -646,11 +800,24 @@ class PhysicsBall(PhysicsObject):
         radius: :class:`LengthType`
             The radius of the ball.
         '''
+        self.__radius = radius
+        self.__stats = PhysicsStats()
+        self.__counts = self.__stats.counts
+        self.reset(position)
+
+    def reset(self, position: VectorType) -> None:
+        '''
+        Reinitialize the ball in place, keeping its radius.
+
+        Parameters
+        ----------
+        position: :class:`VectorType`
+            The vector-like initial position of its center.
+        '''
         self.__pos = Vector(position)
         self.__angle = 0
         self.__v = Vector.zero
         self.__w = 0
-        self.__radius = radius
         self.__onground = False
         self.__ground = None
         self.__bounceable = False
@@ -658,8 +825,9 @@ class PhysicsBall(PhysicsObject):
         self.__collided = False
         self.__collision_exceptions = [self]
         self.__crash_on_rocket = False
-        self.__debug_msgs = []
+        self.__stats.clear()
 
+    @TRACER.trace()
     def tick(self, dt: float, bounce: bool, *objs: Iterable[PhysicsObject]) -> bool:
         '''
         Apply all the interactions.
@@ -678,6 +846,7 @@ class PhysicsBall(PhysicsObject):
         :class:`bool`
             Whether the ball collided.
         '''
+        self.__stats.next_tick()
         self.__pos += self.__v * dt
         self.__angle += self.__w * dt
         self.update_onground()
@@ -693,10 +862,17 @@ class PhysicsBall(PhysicsObject):
             )
         if bounce:
             self.bounce()
-            self.__debug_msgs.append("<bounce>")
+            self.__stats.record(PhysicsEvent.BOUNCE)
+        handled = 0
         for iterable in objs:
             for obj in iterable:
                 self.handle_collision(dt, obj)
+                handled += 1
+        # All the handled objects are counted as missed checks, and the exclusions and the hits 
+        # are taken back in handle_collision, so that nothing is counted on the common path.
+        counts = self.__counts
+        counts[_COLLISION_CHECK] += handled
+        counts[_MISS] += handled
         self.__collision_exceptions = [self]
         if self.__collided:
             self.__collided = False
@@ -713,6 +889,7 @@ class PhysicsBall(PhysicsObject):
         self.set_onground(False)
         self.set_bounceability(False)
 
+    @TRACER.trace()
     def handle_collision(self, dt: float, obj: PhysicsObject) -> None:
         '''
         Detect and handle the collision of the object and this ball. If collision occurs, a 
@@ -729,16 +906,22 @@ class PhysicsBall(PhysicsObject):
             The object to be checked.
         '''
         if obj in self.__collision_exceptions:
+            counts = self.__counts
+            counts[_EXCLUSION] += 1
+            counts[_COLLISION_CHECK] -= 1
+            counts[_MISS] -= 1
             return
         if isinstance(obj, PhysicsRocket):
             if (collision_vector := obj.check_collision(self)) is None:
                 return
             elif collision_vector is True:
+                self.__counts[_MISS] -= 1
                 self.__crash_on_rocket = True
-                self.__debug_msgs.append("<crash: Rocket>")
+                self.__stats.record(PhysicsEvent.CRASH_ROCKET)
                 return
         elif (collision_vector := obj.check_collision(self)) is None:
             return
+        self.__counts[_MISS] -= 1
         if isinstance(obj, PhysicsBall):
             self.collide_with_ball(obj, collision_vector)
         else:
@@ -807,8 +990,8 @@ class PhysicsBall(PhysicsObject):
         ball.__v = v2_perp + v2_para
         self.__collided = True
         ball.__collided = True
-        self.__debug_msgs.append("<collide: Ball>")
-        ball.__debug_msgs.append("<collide: Ball>")
+        self.__stats.record(PhysicsEvent.COLLIDE_BALL)
+        ball.__stats.record(PhysicsEvent.COLLIDE_BALL)
 
     def collide_with_object(self, obj: PhysicsObject, normal_vector: Vector) -> None:
         '''
@@ -838,9 +1021,7 @@ class PhysicsBall(PhysicsObject):
         elif self.__v.y >= 0 and normal_vector * Vector.unit_upward > 0:
             self.set_bounceability(True)
         self.__collided = True
-        self.__debug_msgs.append(
-            f"<collide: {type(obj).__name__.removeprefix("Physics")}>"
-        )
+        self.__stats.record(_COLLIDE_EVENTS[type(obj)])
 
     def remove_wall_stuck(self, wall: PhysicsWall) -> None:
         '''
@@ -860,7 +1041,7 @@ class PhysicsBall(PhysicsObject):
         )
         if abs(distance) <= Constant.WALL_REFLECT_ALLOWED_DISTANCE:
             return
-        self.__debug_msgs.append("<stuck removal: Wall>")
+        self.__stats.record(PhysicsEvent.WALL_STUCK_REMOVAL)
         if self.__onground:
             if wall.facing == Direction.RIGHT:
                 self.__pos.x = wall.x_side + self.__radius
@@ -891,7 +1072,7 @@ class PhysicsBall(PhysicsObject):
         '''
         self.__pos.y = ground.y_top + self.__radius
         self.__v.y = 0
-        self.__debug_msgs.append("<stuck removal: Ground>")
+        self.__stats.record(PhysicsEvent.GROUND_STUCK_REMOVAL)
 
     def handle_friction(
             self, 
@@ -915,6 +1096,7 @@ class PhysicsBall(PhysicsObject):
         multiplier: Optional[:class:`LengthType`]
             The multiplier of time length when applying sliding friction. Default to 1.
         '''
+        self.__counts[_FRICTION] += 1
         tangent_vector = Vector(-normal_vector.y, normal_vector.x).unit
         v_rel = obj_velocity - self.__v
         v_rel_para = v_rel.project_on(tangent_vector)
@@ -1022,6 +1204,26 @@ class PhysicsBall(PhysicsObject):
         if self.__path_length > Constant.MAX_BOUNCABLE_DISTANCE:
             self.set_bounceability(False)
 
+    def restore(self, state: BallState) -> None:
+        '''
+        Restore the ball to a state read from :attr:`state`. Pending collision results are 
+        discarded.
+
+        Parameters
+        ----------
+        state: :class:`BallState`
+            The state to be restored.
+        '''
+        (
+            x, y, self.__angle, v_x, v_y, self.__w, 
+            self.__onground, self.__ground, self.__bounceable, self.__path_length
+        ) = state
+        self.__pos = Vector(x, y)
+        self.__v = Vector(v_x, v_y)
+        self.__collided = False
+        self.__collision_exceptions = [self]
+        self.__crash_on_rocket = False
+
     @property
     def position(self) -> Vector:
         '''
@@ -1086,6 +1288,17 @@ class PhysicsBall(PhysicsObject):
         '''
         return self.__radius
     
+    @property
+    def state(self) -> BallState:
+        '''
+        (Read-only) A compact copy of the mutable state of the ball, which can be passed to 
+        :meth:`restore`.
+        '''
+        return (
+            self.__pos.x, self.__pos.y, self.__angle, self.__v.x, self.__v.y, self.__w, 
+            self.__onground, self.__ground, self.__bounceable, self.__path_length
+        )
+    
     @property
     def crash_on_rocket(self) -> bool:
         '''
@@ -1096,14 +1309,19 @@ class PhysicsBall(PhysicsObject):
         return crash_on_rocket
     
     @property
-    def debug_msgs(self) -> tuple[str]:
+    def stats(self) -> PhysicsStats:
         '''
-        (Read-only) Read the debug messages of the ball. This will also clear the message list 
-        of the :class:`PhysicsBall` instance.
+        (Read-only) The counters of the physics events of the ball.
         '''
-        msgs = tuple(self.__debug_msgs)
-        self.__debug_msgs.clear()
-        return msgs
+        return self.__stats
+
+
+_COLLIDE_EVENTS: dict[type[PhysicsObject], PhysicsEvent] = {
+    PhysicsGround: PhysicsEvent.COLLIDE_GROUND, 
+    PhysicsWall: PhysicsEvent.COLLIDE_WALL, 
+    PhysicsSlab: PhysicsEvent.COLLIDE_SLAB, 
+    PhysicsRocket: PhysicsEvent.COLLIDE_ROCKET
+}
 
 
 class PhysicsParticle:
@@ -1121,6 +1339,18 @@ class PhysicsParticle:
         angle: NumberType, 
         angular_frequency: NumberType
     ) -> None:
+        self.reset(position, velocity, angle, angular_frequency)
+
+    def reset(
+        self, 
+        position: VectorType, 
+        velocity: VectorType, 
+        angle: NumberType, 
+        angular_frequency: NumberType
+    ) -> None:
+        '''
+        Reinitialize the particle in place. The parameters are the same as the constructor.
+        '''
         self.__pos = Vector(position)
         self.__v = Vector(velocity)
         self.__angle = angle
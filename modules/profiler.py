@@ -0,0 +1,206 @@
+from __future__ import annotations
+from .constants import ProfilerConstant as Constant
+from .utils import RingBuffer
+from enum import Enum
+from math import log
+from time import perf_counter
+from json import dump as jsondump
+
+class Phase(Enum):
+    '''
+    The phases of a frame of the main loop.
+    '''
+    EVENT_PUMP = "event pump"
+    ADD_EVENT = "add event"
+    REQUESTS = "requests"
+    GAME_TICK = "game tick"
+    WORLD_DRAW = "world draw"
+    UI_DRAW = "ui draw"
+    CENTER_BLIT = "center blit"
+    DISPLAY_UPDATE = "display update"
+    FRAME = "frame"
+
+
+class Histogram:
+    '''
+    A histogram of the latest samples over logarithmic buckets. The bucket ``i`` holds the
+    samples up to ``HISTOGRAM_MIN_VALUE * HISTOGRAM_GROWTH ** i``, and the last bucket holds
+    all the larger ones. Adding a sample takes O(1) time, since only the sample leaving the
+    window is taken out. The percentiles are read over the fixed number of buckets, and are
+    accurate up to the width of a bucket.
+    '''
+    __counts: list[int]
+    __window: RingBuffer[int]
+    __log_growth: float = log(Constant.HISTOGRAM_GROWTH)
+
+    def __init__(self) -> None:
+        self.__counts = [0] * Constant.HISTOGRAM_BUCKETS
+        self.__window = RingBuffer(Constant.HISTOGRAM_WINDOW)
+
+    @staticmethod
+    def bound(bucket: int) -> float:
+        '''
+        Return the upper bound of the bucket.
+        '''
+        return Constant.HISTOGRAM_MIN_VALUE * Constant.HISTOGRAM_GROWTH ** bucket
+
+    def add(self, value: float) -> None:
+        if value <= Constant.HISTOGRAM_MIN_VALUE:
+            bucket = 0
+        else:
+            bucket = min(
+                Constant.HISTOGRAM_BUCKETS - 1, 
+                int(log(value / Constant.HISTOGRAM_MIN_VALUE) / Histogram.__log_growth) + 1
+            )
+        if len(self.__window) == self.__window.capacity:
+            self.__counts[self.__window[0]] -= 1
+        self.__window.append(bucket)
+        self.__counts[bucket] += 1
+
+    def percentile(self, percent: float) -> float:
+        '''
+        Return the upper bound of the bucket holding the percentile of the samples. Returns 0
+        if there is no sample.
+        '''
+        if not (total := len(self.__window)):
+            return 0
+        rank = max(1, -(-total * percent // 100))
+        for bucket, count in enumerate(self.__counts):
+            rank -= count
+            if rank <= 0:
+                return Histogram.bound(bucket)
+        return Histogram.bound(Constant.HISTOGRAM_BUCKETS - 1)
+
+    def clear(self) -> None:
+        self.__counts = [0] * Constant.HISTOGRAM_BUCKETS
+        self.__window.clear()
+
+    @property
+    def counts(self) -> list[int]:
+        '''
+        (Read-only) The numbers of the samples in the buckets.
+        '''
+        return self.__counts
+
+    def __len__(self) -> int:
+        return len(self.__window)
+
+
+class _Measure:
+    __slots__ = ("profiler", "phase")
+
+    def __init__(self, profiler: Profiler, phase: Phase) -> None:
+        self.profiler = profiler
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.profiler.begin(self.phase)
+
+    def __exit__(self, *_) -> None:
+        self.profiler.end()
+
+
+class Profiler:
+    '''
+    The timer of the phases of the main loop, in unit of millisecond. The time of a phase
+    excludes the phases measured within it, and the times of a phase in a frame are summed
+    into one sample on :meth:`next_frame`. The frame time is the time between two calls of
+    :meth:`next_frame`.
+    '''
+    __histograms: dict[Phase, Histogram]
+    __measures: dict[Phase, _Measure]
+    __frame: dict[Phase, float]
+    __counts: dict[Phase, int]
+    __stack: list[list[Phase | float]]
+    __frame_start: float | None
+
+    def __init__(self) -> None:
+        self.__histograms = {phase: Histogram() for phase in Phase}
+        self.__measures = {phase: _Measure(self, phase) for phase in Phase}
+        self.__frame = dict.fromkeys(Phase, 0)
+        self.__counts = dict.fromkeys(Phase, 0)
+        self.__stack = []
+        self.__frame_start = None
+
+    def begin(self, phase: Phase) -> None:
+        '''
+        Start timing the phase. Phases can be nested, and must be ended in the reverse order.
+        '''
+        self.__stack.append([phase, perf_counter(), 0])
+
+    def end(self) -> None:
+        '''
+        Stop timing the latest begun phase.
+        '''
+        phase, start, nested = self.__stack.pop()
+        elapsed = perf_counter() - start
+        if self.__stack:
+            self.__stack[-1][2] += elapsed
+        self.__frame[phase] += elapsed - nested
+
+    def measure(self, phase: Phase) -> _Measure:
+        '''
+        Return the context manager timing the phase.
+        '''
+        return self.__measures[phase]
+
+    def count(self, phase: Phase, number: int) -> None:
+        '''
+        Record the number of times the phase runs in this frame, such as the game ticks.
+        '''
+        self.__counts[phase] = number
+
+    def next_frame(self) -> None:
+        '''
+        Add the phase times of this frame to the histograms, and start a new frame.
+        '''
+        now = perf_counter()
+        if self.__frame_start is not None:
+            self.__frame[Phase.FRAME] = now - self.__frame_start
+            for phase, histogram in self.__histograms.items():
+                histogram.add(1000 * self.__frame[phase])
+        self.__frame_start = now
+        self.__frame = dict.fromkeys(Phase, 0)
+
+    def percentiles(self, phase: Phase) -> tuple[float, ...]:
+        '''
+        Return the percentiles in ``PERCENTILES`` of the phase time.
+        '''
+        histogram = self.__histograms[phase]
+        return tuple(histogram.percentile(percent) for percent in Constant.PERCENTILES)
+
+    def last_count(self, phase: Phase) -> int:
+        '''
+        Return the number of times the phase runs in the last frame it is counted.
+        '''
+        return self.__counts[phase]
+
+    def dump(self, filepath: str) -> None:
+        '''
+        Write the histograms of all the phases to a JSON file. The buckets are listed by their
+        upper bounds, and the empty buckets are left out.
+        '''
+        with open(filepath, "w") as file:
+            jsondump(
+                {
+                    phase.value: {
+                        "samples": len(histogram), 
+                        "percentiles": dict(
+                            zip(
+                                (f"p{percent}" for percent in Constant.PERCENTILES), 
+                                self.percentiles(phase)
+                            )
+                        ), 
+                        "buckets": {
+                            f"{Histogram.bound(bucket):.4g}": count
+                            for bucket, count in enumerate(histogram.counts) if count
+                        }
+                    }
+                    for phase, histogram in self.__histograms.items()
+                }, 
+                file, 
+                indent=4
+            )
+
+
+PROFILER = Profiler()
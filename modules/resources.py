@@ -7,9 +7,12 @@ import io
 
 # Initial settings
 pygame.init()
-MAIN_SCREEN = pygame.display.set_mode(size = Constant.DEFAULT_SCREEN_SIZE, flags=pygame.RESIZABLE)
+# The screen stays at the default size, and is scaled to the resizable window by SDL
+MAIN_SCREEN = pygame.display.set_mode(
+    size = Constant.DEFAULT_SCREEN_SIZE, 
+    flags=pygame.RESIZABLE | pygame.SCALED
+)
 CENTER_SCREEN = pygame.Surface(Constant.DEFAULT_SCREEN_SIZE)
-HIDDEN_SCREEN = pygame.Surface(Constant.DEFAULT_SCREEN_SIZE)
 pygame.display.set_caption("Bounce!")
 pygame.display.set_icon(pygame.image.load(".\\textures\\icon.png").convert_alpha())
 
@@ -195,6 +198,8 @@ class Path:
     DATAS = ".\\datas.json"
     HIGHSCORE = ".\\highscore.json"
     ERRORLOG = ".\\errors.log"
+    PROFILE = ".\\profile.json"
+    ALLOCATION = ".\\allocation.json"
     class Language:
         ENGLISH = ".\\languages\\English.json"
         JAPANESE = ".\\languages\\Japanese.json"
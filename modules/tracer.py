@@ -0,0 +1,119 @@
+from __future__ import annotations
+from .constants import TracerConstant as Constant
+from .utils import RingBuffer
+from contextlib import nullcontext
+from functools import wraps
+from json import dump as jsondump
+from os import environ, getpid
+from threading import get_ident
+from time import perf_counter_ns
+from typing import Callable
+import atexit
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: Tracer, name: str) -> None:
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = perf_counter_ns()
+
+    def __exit__(self, *_) -> None:
+        self.tracer.record(self.name, self.start, perf_counter_ns())
+
+
+class Tracer:
+    '''
+    The recorder of the spans on the hot paths, written as a Chrome Trace Event file which can
+    be viewed in ``chrome://tracing`` or Perfetto. The spans are appended to an in-memory ring
+    buffer without locking, which keeps the latest spans only, and the file is written on
+    exit.
+
+    The tracer is enabled only if the environment variable ``BOUNCE_TRACE`` is set to the path
+    of the file when the module is imported. Otherwise :meth:`trace` returns the functions
+    undecorated, and :meth:`span` returns a shared empty context manager.
+    '''
+    __filepath: str | None
+    __spans: RingBuffer[tuple[str, int, int, int]] | None
+    __origin: int
+
+    def __init__(self, filepath: str | None) -> None:
+        self.__filepath = filepath
+        self.__spans = None if filepath is None else RingBuffer(Constant.BUFFER_SIZE)
+        self.__origin = perf_counter_ns()
+
+    def record(self, name: str, start: int, end: int) -> None:
+        '''
+        Record a span by its start and end time from :func:`time.perf_counter_ns`.
+        '''
+        self.__spans.append((name, start, end, get_ident()))
+
+    def span(self, name: str) -> _Span | nullcontext:
+        '''
+        Return the context manager recording a span of the name.
+        '''
+        if self.__spans is None:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def trace[**P, R](self, name: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        '''
+        Return the decorator recording a span for each call of the function. The span is named
+        after the qualified name of the function if no name is given.
+        '''
+        def decorator(function: Callable[P, R]) -> Callable[P, R]:
+            if self.__spans is None:
+                return function
+            span_name = function.__qualname__ if name is None else name
+            record = self.record
+
+            @wraps(function)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                start = perf_counter_ns()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    record(span_name, start, perf_counter_ns())
+            return wrapper
+        return decorator
+
+    def flush(self) -> None:
+        '''
+        Write the recorded spans to the file as complete events, in unit of microsecond.
+        '''
+        if self.__spans is None:
+            return
+        pid, origin = getpid(), self.__origin
+        with open(self.__filepath, "w") as file:
+            jsondump(
+                {
+                    "traceEvents": [
+                        {
+                            "name": name,
+                            "ph": "X",
+                            "ts": (start - origin) / 1000,
+                            "dur": (end - start) / 1000,
+                            "pid": pid,
+                            "tid": tid
+                        }
+                        for name, start, end, tid in self.__spans
+                    ],
+                    "displayTimeUnit": "ms"
+                },
+                file
+            )
+
+    @property
+    def enabled(self) -> bool:
+        '''
+        (Read-only) Whether the spans are recorded.
+        '''
+        return self.__spans is not None
+
+
+_NULL_SPAN = nullcontext()
+TRACER = Tracer(environ.get(Constant.ENVIRONMENT_VARIABLE) or None)
+if TRACER.enabled:
+    atexit.register(TRACER.flush)
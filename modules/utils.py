@@ -1,9 +1,9 @@
 from __future__ import annotations
-from collections import deque
+from collections import deque, OrderedDict
 from time import time
 from random import random
 from enum import Enum, auto
-from typing import Iterable, Generator, Callable, NoReturn
+from typing import Iterable, Iterator, Generator, Callable, NamedTuple, NoReturn
 
 class Direction(Enum):
     NONE = auto()
@@ -29,70 +29,236 @@ class classproperty[T, R]:
         raise AttributeError("classproperty has no setter")
 
 
-class LinkedList[T]:
-    class Node[S]:
-        __prev: LinkedList.Node[S] | None
-        __next: LinkedList.Node[S] | None
-        def __init__(self, data: S, prev: LinkedList.Node[S] | None) -> None:
-            self.__data = data
-            self.__prev = prev
-            self.__next = None
-            if prev is not None:
-                prev.__next = self
-
-        def delete(self) -> None:
-            if self.__prev is not None:
-                self.__prev.__next = self.__next
-            if self.__next is not None:
-                self.__next.__prev = self.__prev
-
-        @property
-        def data(self) -> S:
-            return self.__data
-        
-        @property
-        def prev(self) -> LinkedList.Node[S] | None:
-            return self.__prev
-        
-        @property
-        def next(self) -> LinkedList.Node[S] | None:
-            return self.__next
+class Handle(NamedTuple):
+    slot: int
+    generation: int
 
-    __head: Node[T] | None
-    __tail: Node[T] | None
 
-    def __init__(self) -> None:
-        self.__head = self.__tail = None
+class DenseArray[T]:
+    '''
+    A list-like container with O(1) removal, which moves the last element into the removed 
+    position. Appending returns a :class:`Handle` of the element, which stays valid no matter 
+    how the element is moved, and turns stale once the element is removed.
 
-    def append(self, data: T) -> None:
-        self.__tail = LinkedList.Node(data, self.__tail)
-        if self.__head is None:
-            self.__head = self.__tail
+    Iteration is a plain walk over the underlying list. To remove elements during a walk, go 
+    through the indices forward and use :meth:`remove_at`, then visit the same index again, 
+    since the last element is moved into it. The order of the walk is kept as long as nothing 
+    is removed.
+    '''
+    __items: list[T]
+    __item_slots: list[int]
+    __slot_indices: list[int]
+    __slot_generations: list[int]
+    __free_slots: list[int]
 
+    def __init__(self) -> None:
+        self.__items = []
+        self.__item_slots = []
+        self.__slot_indices = []
+        self.__slot_generations = []
+        self.__free_slots = []
+
+    def append(self, item: T) -> Handle:
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+            self.__slot_indices[slot] = len(self.__items)
+        else:
+            slot = len(self.__slot_indices)
+            self.__slot_indices.append(len(self.__items))
+            self.__slot_generations.append(0)
+        self.__items.append(item)
+        self.__item_slots.append(slot)
+        return Handle(slot, self.__slot_generations[slot])
+    
     def extend(self, iterable: Iterable[T]) -> None:
-        for element in iterable:
-            self.append(element)
+        for item in iterable:
+            self.append(item)
+
+    def remove_at(self, index: int) -> T:
+        '''
+        Remove and return the element at the index. The last element is moved into the index.
+        '''
+        items, item_slots = self.__items, self.__item_slots
+        item, slot = items[index], item_slots[index]
+        last_item, last_slot = items.pop(), item_slots.pop()
+        if index < len(items):
+            items[index] = last_item
+            item_slots[index] = last_slot
+            self.__slot_indices[last_slot] = index
+        self.__slot_indices[slot] = -1
+        self.__slot_generations[slot] += 1
+        self.__free_slots.append(slot)
+        return item
+    
+    def remove(self, handle: Handle) -> T:
+        '''
+        Remove and return the element of the handle. Raises :class:`KeyError` if the handle is 
+        stale.
+        '''
+        if handle not in self:
+            raise KeyError(handle)
+        return self.remove_at(self.__slot_indices[handle.slot])
+    
+    def get(self, handle: Handle) -> T | None:
+        '''
+        Get the element of the handle. Returns ``None`` if the handle is stale.
+        '''
+        if handle not in self:
+            return None
+        return self.__items[self.__slot_indices[handle.slot]]
+    
+    def clear(self) -> None:
+        for slot in self.__item_slots:
+            self.__slot_indices[slot] = -1
+            self.__slot_generations[slot] += 1
+            self.__free_slots.append(slot)
+        self.__items.clear()
+        self.__item_slots.clear()
+
+    def __contains__(self, handle: Handle) -> bool:
+        slot, generation = handle
+        return (
+            0 <= slot < len(self.__slot_generations)
+            and self.__slot_generations[slot] == generation
+            and self.__slot_indices[slot] >= 0
+        )
+
+    def __len__(self) -> int:
+        return len(self.__items)
     
-    def pop(self, node: Node[T]) -> None:
-        node.delete()
-        if self.__head is node:
-            self.__head = node.next
-        if self.__tail is node:
-            self.__tail = node.prev
+    def __getitem__(self, index: int) -> T:
+        return self.__items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__items)
+
+
+class RingBuffer[T]:
+    '''
+    A list-like buffer with a fixed capacity. Appending to a full buffer overwrites its oldest
+    element. Indexing and iteration go from the oldest element to the newest one.
+    '''
+    __buffer: list[T | None]
+    __capacity: int
+    __start: int
+    __length: int
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.__buffer = [None] * capacity
+        self.__capacity = capacity
+        self.__start = 0
+        self.__length = 0
+
+    def append(self, item: T) -> None:
+        if self.__length < self.__capacity:
+            self.__buffer[(self.__start + self.__length) % self.__capacity] = item
+            self.__length += 1
+        else:
+            self.__buffer[self.__start] = item
+            self.__start = (self.__start + 1) % self.__capacity
+
+    def pop(self) -> T:
+        '''
+        Remove and return the newest element.
+        '''
+        if not self.__length:
+            raise IndexError("pop from an empty RingBuffer")
+        self.__length -= 1
+        index = (self.__start + self.__length) % self.__capacity
+        item = self.__buffer[index]
+        self.__buffer[index] = None
+        return item
+
+    def clear(self) -> None:
+        self.__buffer = [None] * self.__capacity
+        self.__start = 0
+        self.__length = 0
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError("RingBuffer index out of range")
+        return self.__buffer[(self.__start + index) % self.__capacity]
+
+    def __iter__(self) -> Generator[T, None, None]:
+        for i in range(self.__length):
+            yield self.__buffer[(self.__start + i) % self.__capacity]
+
+    def __reversed__(self) -> Generator[T, None, None]:
+        for i in range(self.__length - 1, -1, -1):
+            yield self.__buffer[(self.__start + i) % self.__capacity]
 
     @property
-    def data_iter(self) -> Generator[T, None, None]:
-        node = self.__head
-        while node is not None:
-            yield node.data
-            node = node.next
+    def capacity(self) -> int:
+        return self.__capacity
+
+
+class LRUCache[K, V]:
+    '''
+    A mapping with a fixed capacity. Storing into a full cache evicts its least recently used 
+    entry. The hits and misses of :meth:`get` are counted.
+    '''
+    __entries: OrderedDict[K, V]
+    __capacity: int
+    __hits: int
+    __misses: int
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.__entries = OrderedDict()
+        self.__capacity = capacity
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key: K) -> V | None:
+        '''
+        Get the value of the key and mark it as the most recently used. Returns ``None`` if the 
+        key is not cached.
+        '''
+        try:
+            value = self.__entries[key]
+        except KeyError:
+            self.__misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return value
+    
+    def put(self, key: K, value: V) -> None:
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__capacity:
+            self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __contains__(self, key: K) -> bool:
+        return key in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
 
     @property
-    def node_iter(self) -> Generator[Node[T], None, None]:
-        node = self.__head
-        while node is not None:
-            yield node
-            node = node.next
+    def capacity(self) -> int:
+        return self.__capacity
+    
+    @property
+    def hits(self) -> int:
+        return self.__hits
+    
+    @property
+    def misses(self) -> int:
+        return self.__misses
 
 
 class Timer:
@@ -232,15 +398,18 @@ class FPSCounter:
     def __init__(self, counts: int, start: bool = True) -> None:
         self.__counter = deque(maxlen=counts)
         self.__counts = counts
+        self.__sum = 0
 
     def append(self, milliseconds: int) -> None:
         if not self.__counter:
             self.__counter.extend((milliseconds, ) * self.__counts)
+            self.__sum = milliseconds * self.__counts
         else:
+            self.__sum += milliseconds - self.__counter[0]
             self.__counter.append(milliseconds)
 
     def read(self) -> int:
-        return 1000 * self.__counts // sum(self.__counter)
+        return 1000 * self.__counts // self.__sum
     
 def time_string(second: float) -> str:
     return f"{int(second // 60):02d}:{int(second % 60):02d}"
\ No newline at end of file